@@ -12,7 +12,7 @@ from pathlib import Path
 import bittensor as bt
 from pydantic import BaseModel, Field, HttpUrl
 
-from .epoch import epoch_start
+from .epoch import epoch_index, epoch_meta
 
 DEFAULT_VERIFIER_URL = "https://api.cartha.finance"
 
@@ -77,9 +77,10 @@ class ValidatorSettings(BaseModel):
         description="List of validator hotkey SS58 addresses allowed to query verified miners. Empty list means all validators are allowed.",
     )
     # Timing and sync configuration
-    metagraph_sync_interval: int = Field(
-        default=100,
-        description="Sync metagraph every N blocks (default: 100 blocks, ~20 minutes)",
+    metagraph_sync_interval: int | None = Field(
+        default=None,
+        ge=1,
+        description="Sync metagraph every N blocks (default: None = half the subnet tempo, at least 50 blocks)",
     )
     default_tempo: int = Field(
         default=360,
@@ -107,6 +108,11 @@ class ValidatorSettings(BaseModel):
         default=300,
         description="Polling interval in seconds when running continuously (default: 300 = 5 minutes)",
     )
+    replay_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum number of on-chain position replays run in parallel (default: 8)",
+    )
     # Logging configuration
     log_dir: str = Field(
         default="validator_logs",
@@ -145,7 +151,6 @@ DEFAULT_SETTINGS = ValidatorSettings(
     rpc_urls={31337: "http://localhost:8545"},
     pool_weights={"default": 1.0},
     max_lock_days=365,
-    metagraph_sync_interval=100,
     default_tempo=360,
     epoch_length_blocks=360,
     testnet_netuid=78,
@@ -156,6 +161,22 @@ DEFAULT_SETTINGS = ValidatorSettings(
 )
 
 
+class _ConfigNamespace:
+    """Simple namespace for nested Bittensor config attributes.
+
+    Note: bt.config() was removed in newer bittensor versions, so the validator
+    builds the wallet/subtensor/logging config tree itself.
+    """
+
+    def __init__(self, **kwargs: object) -> None:
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+    def __repr__(self) -> str:
+        attrs = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        return f"Config({attrs})"
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command-line arguments for the validator.
 
@@ -237,6 +258,12 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_SETTINGS.poll_interval,
         help=f"Polling interval in seconds when running continuously (default: {DEFAULT_SETTINGS.poll_interval} = {DEFAULT_SETTINGS.poll_interval // 60} minutes).",
     )
+    parser.add_argument(
+        "--replay-concurrency",
+        type=int,
+        default=DEFAULT_SETTINGS.replay_concurrency,
+        help=f"Maximum number of on-chain position replays run in parallel (default: {DEFAULT_SETTINGS.replay_concurrency}).",
+    )
     parser.add_argument(
         "--log-dir",
         type=str,
@@ -274,35 +301,24 @@ def parse_args() -> argparse.Namespace:
         "--logging.debug=False" in sys.argv or "--no-logging.debug" in sys.argv
     )
 
-    # Create a simple config namespace for Bittensor components
-    # Note: bt.config() was removed in newer bittensor versions
-    class SimpleNamespace:
-        """Simple namespace for nested config attributes."""
-        def __init__(self, **kwargs: object) -> None:
-            for key, value in kwargs.items():
-                setattr(self, key, value)
-        
-        def __repr__(self) -> str:
-            attrs = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
-            return f"Config({attrs})"
-    
     # Get subtensor network from parsed args (handles both attribute styles)
     subtensor_network = (
         getattr(parsed_args, "subtensor_network", None) 
         or getattr(parsed_args, "subtensor.network", None)
     )
     
-    config = SimpleNamespace(
-        wallet=SimpleNamespace(
+    # Create a simple config namespace for Bittensor components
+    config = _ConfigNamespace(
+        wallet=_ConfigNamespace(
             name=parsed_args.wallet_name or "default",
             hotkey=parsed_args.wallet_hotkey or "default",
             path="~/.bittensor/wallets",
         ),
-        subtensor=SimpleNamespace(
+        subtensor=_ConfigNamespace(
             network=subtensor_network,
             chain_endpoint=getattr(parsed_args, "subtensor.chain_endpoint", None),
         ),
-        logging=SimpleNamespace(
+        logging=_ConfigNamespace(
             debug=not debug_explicitly_disabled,
             trace=False,
             record_log=False,
@@ -328,5 +344,5 @@ def epoch_version(value: str | None) -> str:
     """
     if value:
         return value
-    start = epoch_start()
-    return start.strftime("%Y-%m-%dT%H:%M:%SZ")
+    # Cached per weekly epoch index; no datetime/strftime work once computed
+    return epoch_meta(epoch_index())[2]
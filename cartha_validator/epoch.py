@@ -3,27 +3,28 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 
 import bittensor as bt
 
 EPOCH_LENGTH = timedelta(days=7)
+EPOCH_SECONDS = int(EPOCH_LENGTH.total_seconds())
+EPOCH_VERSION_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+# Integer-formatting equivalent of EPOCH_VERSION_FORMAT (no strftime/locale work)
+_EPOCH_VERSION_TEMPLATE = "%04d-%02d-%02dT%02d:%02d:%02dZ"
+
+# First Friday 00:00 UTC after the Unix epoch; epoch indices count weeks from here
+_EPOCH_ANCHOR = datetime(1970, 1, 2, tzinfo=UTC)
+_EPOCH_ANCHOR_TS = int(_EPOCH_ANCHOR.timestamp())
 
 
 def epoch_start(reference: datetime | None = None) -> datetime:
-    """Return the start (Friday 00:00 UTC) of the epoch that contains reference."""
-    reference = reference or datetime.now(tz=UTC)
-    weekday = reference.weekday()  # Monday=0
-    days_since_friday = (weekday - 4) % 7
-    start = datetime(
-        year=reference.year,
-        month=reference.month,
-        day=reference.day,
-        hour=0,
-        minute=0,
-        tzinfo=UTC,
-    ) - timedelta(days=days_since_friday)
-    bt.logging.debug(f"Computed epoch start {start} from reference {reference}")
-    return start
+    """Return the start (Friday 00:00 UTC) of the epoch that contains reference.
+
+    Naive references are treated as UTC. The result comes from the per-index
+    ``epoch_meta`` cache, so it is computed once per week.
+    """
+    return epoch_meta(epoch_index(reference))[0]
 
 
 def epoch_end(reference: datetime | None = None) -> datetime:
@@ -32,3 +33,44 @@ def epoch_end(reference: datetime | None = None) -> datetime:
     end = start + EPOCH_LENGTH - timedelta(minutes=1)
     bt.logging.debug(f"Computed epoch end {end}")
     return end
+
+
+def epoch_index(reference: datetime | None = None) -> int:
+    """Return the integer index of the weekly epoch that contains reference."""
+    reference = reference or datetime.now(tz=UTC)
+    if reference.tzinfo is None:
+        reference = reference.replace(tzinfo=UTC)
+    return epoch_index_at(reference.timestamp())
+
+
+def epoch_index_at(timestamp: float) -> int:
+    """Return the weekly epoch index for a UNIX timestamp (e.g. ``time.time()``)."""
+    return int((timestamp - _EPOCH_ANCHOR_TS) // EPOCH_SECONDS)
+
+
+def epoch_start_ts(index: int) -> int:
+    """Return the UNIX timestamp at which the weekly epoch with the given index starts."""
+    return _EPOCH_ANCHOR_TS + index * EPOCH_SECONDS
+
+
+def format_epoch_version(start: datetime) -> str:
+    """Render an epoch start as its version string (``EPOCH_VERSION_FORMAT``)."""
+    return _EPOCH_VERSION_TEMPLATE % (
+        start.year,
+        start.month,
+        start.day,
+        start.hour,
+        start.minute,
+        start.second,
+    )
+
+
+@lru_cache(maxsize=4)
+def epoch_meta(index: int) -> tuple[datetime, datetime, str]:
+    """Return (start, next_start, version) for the weekly epoch with the given index.
+
+    Cached per index, so repeated lookups within a week cost a dict hit instead of
+    rebuilding datetimes and re-formatting the version string.
+    """
+    start = _EPOCH_ANCHOR + index * EPOCH_LENGTH
+    return start, start + EPOCH_LENGTH, format_epoch_version(start)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
 import json
 import textwrap
 from collections import Counter
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -12,6 +14,11 @@ from typing import Any
 import bittensor as bt
 import httpx
 
+try:  # optional fast JSON encoder; the stdlib encoder is used when it is absent
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
 from .config import ValidatorSettings
 from .indexer import replay_owner
 from .logging import (
@@ -65,6 +72,29 @@ def _format_http_error(exc: httpx.HTTPStatusError) -> str:
         return textwrap.indent(response_text, "  ")
 
 
+def _dump_json(obj: Any, *, indent: bool) -> bytes:
+    """Serialise ``obj`` to UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        obj: JSON-compatible payload (non-string dict keys are stringified)
+        indent: Pretty-print with two-space indentation instead of compact output
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits (e.g. huge raw token amounts);
+            # the stdlib encoder handles arbitrary-precision ints
+            pass
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
 def run_epoch(
     verifier_url: str,
     epoch_version: str,
@@ -82,6 +112,9 @@ def run_epoch(
     args: Any | None = None,
     force: bool = False,
     hotkey_ss58: str | None = None,
+    http_client: httpx.Client | None = None,
+    hotkey_to_uid: Mapping[str, int] | None = None,
+    leaderboard_client: httpx.Client | None = None,
 ) -> dict[str, Any]:
     """Run a single epoch: fetch entries, process, score, and publish weights.
 
@@ -101,6 +134,12 @@ def run_epoch(
         args: Command-line arguments (for log_dir)
         force: If True, bypass cooldown check and always attempt to set weights (e.g., on startup)
         hotkey_ss58: Hotkey SS58 address (optional, derived from wallet if not provided)
+        http_client: Long-lived verifier client (base_url=verifier_url) to reuse across
+            runs; a short-lived client is created and closed if None
+        hotkey_to_uid: Hotkey→UID index of the synced metagraph (optional, built from
+            metagraph.hotkeys if None)
+        leaderboard_client: Long-lived client for leaderboard submissions (optional,
+            a short-lived client is used if None)
 
     Returns:
         Dictionary with scores, weights, ranking, and summary
@@ -142,7 +181,11 @@ def run_epoch(
     )
 
     try:
-        with httpx.Client(base_url=verifier_url, timeout=timeout) as client:
+        with (
+            contextlib.nullcontext(http_client)
+            if http_client is not None
+            else httpx.Client(base_url=verifier_url, timeout=timeout)
+        ) as client:
             # Build query parameters - always include validator_hotkey for server-side whitelist check
             # Also include network/netuid for testnet detection on verifier side
             params = {
@@ -258,20 +301,19 @@ def run_epoch(
     except httpx.RequestError as exc:
         bt.logging.error(
             f"{ANSI_BOLD}{ANSI_RED}[VERIFIER REQUEST ERROR]{ANSI_RESET} "
-            f"Failed to connect to verifier: {exc}"
+            f"Failed to connect to verifier: {exc}\n"
+            f"URL: {verifier_url}/v1/verified-miners\n"
+            f"Error type: {type(exc).__name__}"
         )
-        bt.logging.error(f"URL: {verifier_url}/v1/verified-miners")
-        bt.logging.error(f"Error type: {type(exc).__name__}")
         raise RuntimeError(f"Failed to connect to verifier at {verifier_url}: {exc}") from exc
     except Exception as exc:
         bt.logging.error(
             f"{ANSI_BOLD}{ANSI_RED}[VERIFIER ERROR]{ANSI_RESET} "
-            f"Unexpected error fetching verified miners: {exc}"
+            f"Unexpected error fetching verified miners: {exc}\n"
+            f"Error type: {type(exc).__name__}\n"
+            f"URL: {verifier_url}/v1/verified-miners?epoch={epoch_version}",
+            exc_info=True,
         )
-        bt.logging.error(f"Error type: {type(exc).__name__}")
-        bt.logging.error(f"URL: {verifier_url}/v1/verified-miners?epoch={epoch_version}")
-        import traceback
-        bt.logging.error(f"Traceback:\n{traceback.format_exc()}")
         raise
 
     # Confirm epoch version: verify all entries match the requested epoch
@@ -279,26 +321,21 @@ def run_epoch(
     # This is expected behavior and ensures validators only use frozen epoch data
     actual_epoch_version = None
     if entries:
-        # Check if all entries have the same epoch_version
-        epoch_versions = {
-            entry.get("epoch_version")
+        # Tally epoch versions in a single pass over the entries
+        epoch_counts = Counter(
+            entry_epoch
             for entry in entries
-            if entry.get("epoch_version")
-        }
-        if len(epoch_versions) == 1:
-            actual_epoch_version = epoch_versions.pop()
-        elif len(epoch_versions) > 1:
+            if (entry_epoch := entry.get("epoch_version"))
+        )
+        if len(epoch_counts) == 1:
+            actual_epoch_version = next(iter(epoch_counts))
+        elif len(epoch_counts) > 1:
             # Multiple different epochs - this is unexpected
             bt.logging.warning(
                 f"{ANSI_BOLD}{ANSI_YELLOW}{EMOJI_WARNING} Multiple epoch versions in response:{ANSI_RESET} "
-                f"{epoch_versions}. {ANSI_DIM}This may indicate a verifier issue.{ANSI_RESET}"
+                f"{set(epoch_counts)}. {ANSI_DIM}This may indicate a verifier issue.{ANSI_RESET}"
             )
             # Use the most common epoch version
-            epoch_counts = Counter(
-                entry.get("epoch_version")
-                for entry in entries
-                if entry.get("epoch_version")
-            )
             actual_epoch_version = epoch_counts.most_common(1)[0][0]
 
         if actual_epoch_version and actual_epoch_version != epoch_version:
@@ -340,10 +377,8 @@ def run_epoch(
     
     # Update settings with queried weights (create a copy to avoid mutating original)
     if queried_weights:
-        # Create a new settings object with updated pool_weights
-        settings_dict = settings.model_dump()
-        settings_dict["pool_weights"] = queried_weights
-        settings = ValidatorSettings(**settings_dict)
+        # Shallow copy with only pool_weights replaced; skips re-validating every field
+        settings = settings.model_copy(update={"pool_weights": dict(queried_weights)})
         bt.logging.info(
             f"{ANSI_BOLD}{ANSI_GREEN}[POOL WEIGHTS]{ANSI_RESET} "
             f"Updated pool weights from chain: {len(queried_weights)} pools"
@@ -368,6 +403,7 @@ def run_epoch(
         use_verified_amounts=use_verified_amounts,
         deregistered_hotkeys=deregistered_hotkeys,
         force=force,
+        hotkey_to_uid=hotkey_to_uid,
     )
 
     # Include the actual epoch version used (may differ from requested if fallback occurred)
@@ -461,7 +497,9 @@ def run_epoch(
         "ranking": ranking_payload,
     }
 
-    log_file.write_text(json.dumps(log_entry, indent=2))
+    # Compact JSON in production (written every Bittensor epoch); indented for dry-runs,
+    # which are usually inspected by hand. Both remain readable with `jq`.
+    log_file.write_bytes(_dump_json(log_entry, indent=dry_run))
     bt.logging.info(
         f"{ANSI_BOLD}{ANSI_GREEN}{EMOJI_BLOCK} Weight vector saved{ANSI_RESET} "
         f"to {ANSI_DIM}{log_file}{ANSI_RESET}"
@@ -483,7 +521,7 @@ def run_epoch(
                 f"score={ANSI_GREEN}{item['score']:.6f}{ANSI_RESET} "
                 f"weight={ANSI_BRIGHT_GREEN}{item['weight']:.6f}{ANSI_RESET}"
             )
-        bt.logging.debug(f"Full ranking:\n{json.dumps(ranking_payload, indent=2)}")
+        bt.logging.debug(f"Full ranking:\n{_dump_json(ranking_payload, indent=True).decode()}")
     else:
         # In production mode, log summary with top miners
         bt.logging.info(
@@ -503,7 +541,7 @@ def run_epoch(
                 f"weight={ANSI_BRIGHT_GREEN}{item['weight']:.6f}{ANSI_RESET}"
             )
         if len(result["ranking"]) > 5:
-            bt.logging.debug(f"Full ranking:\n{json.dumps(ranking_payload, indent=2)}")
+            bt.logging.debug(f"Full ranking:\n{_dump_json(ranking_payload, indent=True).decode()}")
         
         # Send ranking to leaderboard API (only if not dry-run and weights published successfully)
         if not dry_run and settings.leaderboard_api_url:
@@ -513,6 +551,7 @@ def run_epoch(
                     validator_hotkey=validator_hotkey,
                     epoch_version=epoch_version,
                     ranking_data=ranking_payload,
+                    client=leaderboard_client,
                 )
             except Exception as e:
                 bt.logging.warning(
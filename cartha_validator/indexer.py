@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import Any
 
 import bittensor as bt
+import requests
 from hexbytes import HexBytes
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 
 from .config import DEFAULT_SETTINGS
@@ -18,6 +21,30 @@ try:
 except FileNotFoundError:  # pragma: no cover
     _VAULT_ABI: list[dict[str, Any]] = []
 
+# Keep-alive connections kept per RPC host by each thread's session
+RPC_POOL_MAXSIZE = 32
+
+_rpc_sessions = threading.local()
+
+
+def get_rpc_session() -> requests.Session:
+    """Return this thread's pooled HTTP session for Web3 providers.
+
+    ``requests.Session`` is not documented as thread-safe, so the daemon loop and
+    each replay worker get their own session rather than sharing one; web3 likewise
+    caches the session handed to an HTTPProvider per thread and endpoint. Within a
+    thread, every chain's HTTPProvider reuses the session, so keep-alive connections
+    are pooled per RPC host instead of each provider opening its own small pool.
+    """
+    session: requests.Session | None = getattr(_rpc_sessions, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=RPC_POOL_MAXSIZE, pool_maxsize=RPC_POOL_MAXSIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _rpc_sessions.session = session
+    return session
+
 
 def lock_id(owner: str, pool_id: bytes) -> HexBytes:
     """Compute the deterministic lock identifier."""
@@ -41,7 +68,7 @@ def _get_web3(chain_id: int) -> Web3:
         msg = f"No RPC URL configured for chain_id={chain_id}"
         bt.logging.error(msg)
         raise ValueError(msg)
-    return Web3(Web3.HTTPProvider(rpc_url))
+    return Web3(Web3.HTTPProvider(rpc_url, session=get_rpc_session()))
 
 
 def _gather_events(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 from typing import Any
 
 import httpx
@@ -9,12 +10,16 @@ import bittensor as bt
 
 from .logging import ANSI_BOLD, ANSI_GREEN, ANSI_RESET, ANSI_YELLOW
 
+# HTTP timeout for ranking submissions
+LEADERBOARD_TIMEOUT_SECONDS = 30.0
+
 
 def send_ranking_to_leaderboard(
     leaderboard_url: str,
     validator_hotkey: str,
     epoch_version: str,
     ranking_data: list[dict[str, Any]],
+    client: httpx.Client | None = None,
 ) -> None:
     """
     Send ranking data to leaderboard API.
@@ -24,6 +29,8 @@ def send_ranking_to_leaderboard(
         validator_hotkey: Validator hotkey SS58 address
         epoch_version: Epoch version identifier
         ranking_data: List of ranking entries (from ranking_payload)
+        client: Long-lived client to reuse across submissions; a short-lived client
+            is created and closed if None
         
     Note:
         Errors are caught and logged, never raised (non-blocking).
@@ -37,8 +44,12 @@ def send_ranking_to_leaderboard(
             "ranking": ranking_data,
         }
         
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(url, json=payload)
+        with (
+            contextlib.nullcontext(client)
+            if client is not None
+            else httpx.Client(timeout=LEADERBOARD_TIMEOUT_SECONDS)
+        ) as session:
+            response = session.post(url, json=payload)
             response.raise_for_status()
             
             result = response.json()
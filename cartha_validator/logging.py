@@ -1,5 +1,7 @@
 """ANSI color codes and emoji helpers for validator logging."""
 
+import bittensor as bt
+
 # ANSI escape codes for terminal colors
 ANSI_RESET = "\033[0m"
 ANSI_BOLD = "\033[1m"
@@ -57,6 +59,18 @@ def style(text: str, color: str = "", bold: bool = False, emoji: str = "") -> st
     return " ".join(parts)
 
 
+def is_enabled_for(level: int) -> bool:
+    """Return True if bittensor logging currently emits records at ``level``.
+
+    Lets hot paths skip building decorated log messages that would be dropped.
+    """
+    try:
+        current = bt.logging.get_level()
+    except Exception:  # pragma: no cover - older bittensor without get_level()
+        return True
+    return not isinstance(current, int) or current <= level
+
+
 __all__ = [
     "ANSI_RESET",
     "ANSI_BOLD",
@@ -88,5 +102,6 @@ __all__ = [
     "EMOJI_STOPWATCH",
     "EMOJI_BLOCK",
     "EMOJI_NETWORK",
+    "is_enabled_for",
     "style",
 ]
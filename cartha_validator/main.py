@@ -3,14 +3,31 @@
 from __future__ import annotations
 
 import atexit
+import contextlib
+import functools
+import importlib
+import json
+import logging
+import operator
+import os
+import random
+import signal
+import threading
 import time
-from datetime import UTC, datetime, timedelta
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import FrameType
+from typing import Any, TypeVar
 
 import bittensor as bt
+import httpx
+import tenacity
 
 from .config import DEFAULT_SETTINGS, epoch_version, parse_args
-from .epoch import epoch_start
+from .epoch import epoch_index_at, epoch_meta, epoch_start_ts
 from .epoch_runner import run_epoch
+from .leaderboard_client import LEADERBOARD_TIMEOUT_SECONDS
 from .logging import (
     ANSI_BOLD,
     ANSI_CYAN,
@@ -28,7 +45,9 @@ from .logging import (
     EMOJI_ROCKET,
     EMOJI_SUCCESS,
     EMOJI_WARNING,
+    is_enabled_for,
 )
+from .metagraph import index_hotkeys, load_metagraph
 from .weights import publish
 
 
@@ -42,6 +61,415 @@ def _epoch_version(value: str | None) -> str:
     return epoch_version(value)
 
 
+# Log templates for the daemon loop, built once at import so each poll only
+# interpolates the dynamic fields.
+_SUCCESS_PREFIX = f"{ANSI_BOLD}{ANSI_GREEN}{EMOJI_SUCCESS} "
+_WARNING_PREFIX = f"{ANSI_BOLD}{ANSI_YELLOW}{EMOJI_WARNING} "
+_RESYNC_MSG = f"{ANSI_BOLD}{ANSI_CYAN}{EMOJI_NETWORK} resync_metagraph(){ANSI_RESET}"
+_TEMPO_CHANGED_FMT = f"{ANSI_BOLD}{ANSI_YELLOW} Tempo changed:{ANSI_RESET} %s → %s"
+_METAGRAPH_UPDATED_TEMPLATE = (
+    f"{_SUCCESS_PREFIX}Metagraph updated{ANSI_RESET} "
+    f"metagraph(netuid:{ANSI_BOLD}{{netuid}}{ANSI_RESET}, "
+    f"n:{ANSI_BOLD}{{n}}{ANSI_RESET}, "
+    f"block:{ANSI_BOLD}{{block}}{ANSI_RESET}, "
+    f"tempo:{ANSI_BOLD}{{tempo}}{ANSI_RESET}, "
+    f"network:{ANSI_BOLD}{{network}}{ANSI_RESET})"
+)
+_RESTART_DETECTED_FMT = (
+    f"{ANSI_BOLD}{ANSI_CYAN}{EMOJI_ROCKET} Validator restart detected{ANSI_RESET} "
+    f"during weekly epoch {ANSI_BOLD}%s{ANSI_RESET}. "
+    f"{ANSI_DIM}Fetching frozen epoch list...{ANSI_RESET}"
+)
+_NEW_EPOCH_FMT = (
+    f"{ANSI_BOLD}{ANSI_MAGENTA}{EMOJI_COIN} New weekly epoch detected:{ANSI_RESET} "
+    f"{ANSI_BOLD}%s{ANSI_RESET} "
+    f"{ANSI_DIM}(previous: %s){ANSI_RESET}"
+)
+_STEP_FMT = f"{ANSI_DIM}step(%s) block(%s){ANSI_RESET}"
+_EPOCH_CACHED_FMT = (
+    f" {ANSI_BOLD}%s{ANSI_RESET}. "
+    f"{ANSI_DIM}Will refresh list and publish weights every Bittensor epoch (~%s blocks) throughout the week.{ANSI_RESET}"
+)
+_BITTENSOR_EPOCH_FMT = (
+    f"{ANSI_BOLD}{ANSI_CYAN}{EMOJI_ROCKET} Bittensor epoch reached{ANSI_RESET} "
+    f"for weekly epoch {ANSI_BOLD}%s{ANSI_RESET} "
+    f"{ANSI_DIM}(%s/%s blocks). "
+    f"Refreshing verified miners list to check for mid-day changes...{ANSI_RESET}"
+)
+_MID_DAY_CHANGES_FMT = (
+    f"{ANSI_BOLD}{ANSI_YELLOW} Mid-day changes detected{ANSI_RESET}: "
+    f"%s expired/released/deregistered pools filtered"
+)
+_WEIGHTS_PUBLISHED_FMT = f" {ANSI_DIM}(%s miners, weekly epoch %s){ANSI_RESET}"
+_WAITING_FMT = (
+    f"{ANSI_DIM}Waiting for Bittensor epoch: %s/%s blocks "
+    f"(weekly epoch: %s){ANSI_RESET}"
+)
+_UID_MISSING_FMT = (
+    f"{ANSI_DIM}Validator hotkey not in metagraph; skipping weight publishing "
+    f"(weekly epoch: %s){ANSI_RESET}"
+)
+_HEARTBEAT_FMT = (
+    f"{ANSI_DIM}Validator running... weekly epoch: %s, "
+    f"block: ~%s, next check in %.0fs{ANSI_RESET}"
+)
+
+
+def _log_success(title: str, detail: str = "") -> None:
+    """Log a bold green success line, skipping the string build when INFO is off."""
+    if is_enabled_for(logging.INFO):
+        bt.logging.info(_SUCCESS_PREFIX + title + ANSI_RESET + detail)
+
+
+def _log_warning(title: str, detail: str = "") -> None:
+    """Log a bold yellow warning line, skipping the string build when WARNING is off."""
+    if is_enabled_for(logging.WARNING):
+        bt.logging.warning(_WARNING_PREFIX + title + ANSI_RESET + detail)
+
+
+# Target Bittensor block time, used to estimate when the next tempo can be reached
+BLOCK_TIME_SECONDS = 12.0
+# Minimum spacing between "Validator running..." heartbeat lines
+HEARTBEAT_INTERVAL_SECONDS = 60.0
+# Minimum spacing between full tracebacks for a repeating loop error
+TRACEBACK_LOG_INTERVAL_SECONDS = 60.0
+# First retry delay after a loop error; doubles per consecutive failure up to poll_interval
+ERROR_BACKOFF_BASE_SECONDS = 5.0
+# Largest random stretch of a loop error backoff, as a fraction of the delay
+ERROR_BACKOFF_JITTER_FRACTION = 0.1
+# In-place retries for a single chain read before the whole loop iteration is failed
+TRANSIENT_RETRY_ATTEMPTS = 5
+TRANSIENT_RETRY_BASE_SECONDS = 0.1
+TRANSIENT_RETRY_MAX_SECONDS = 5.0
+# Connection failures of the substrate websocket stack, as (module, name); none of
+# them subclass ConnectionError, and whichever modules are not installed are skipped
+_SUBSTRATE_CONNECTION_ERRORS = (
+    ("websockets.exceptions", "ConnectionClosed"),
+    ("websocket", "WebSocketException"),
+    ("async_substrate_interface.errors", "SubstrateRequestException"),
+    ("substrateinterface.exceptions", "SubstrateRequestException"),
+)
+# Bugs in our own code: retrying cannot fix them, so the daemon fails loudly instead
+_PROGRAMMER_ERRORS = (TypeError, AttributeError, NameError, ImportError)
+# Source directory of this package, used to tell its own bugs from library errors
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+# Seconds to wait past the Friday 00:00 UTC boundary before fetching the new frozen list
+EPOCH_ROLLOVER_GRACE_SECONDS = 5.0
+# Shortest idle wait between loop iterations
+MIN_IDLE_WAIT_SECONDS = 1.0
+# Fraction of the time left until the next chain check slept per idle wait
+ADAPTIVE_WAIT_FRACTION = 0.5
+# Floor for the tempo-derived metagraph sync interval, so small-tempo subnets don't resync constantly
+MIN_METAGRAPH_SYNC_INTERVAL_BLOCKS = 50
+
+
+def _metagraph_sync_interval(tempo: int, configured: int | None) -> int:
+    """Return the blocks between periodic metagraph syncs.
+
+    An explicitly configured interval wins; otherwise sync twice per tempo, since
+    ``last_update`` and the hotkey set only matter once per weight-setting window.
+    """
+    if configured:
+        return configured
+    return max(MIN_METAGRAPH_SYNC_INTERVAL_BLOCKS, tempo // 2)
+
+
+def _idle_wait_seconds(
+    poll_interval: float,
+    seconds_until_rollover: float,
+    seconds_until_chain_check: float = 0.0,
+    work_seconds: float = 0.0,
+) -> float:
+    """Return how long the daemon should idle before its next check.
+
+    The regular cadence is ``poll_interval``, measured from the start of the
+    iteration: ``work_seconds`` already spent on chain reads, verifier refreshes
+    and publishing is deducted, so a cycle lasts max(work, poll) rather than
+    work + poll. While the next chain check is further
+    away than that, the wait stretches to half the remaining time, so wakeups thin
+    out geometrically and cluster near the tempo boundary. When the next chain check
+    falls inside the poll window, the loop wakes right at it instead of up to a full
+    ``poll_interval`` past the tempo boundary. The wait is always cut short so the
+    loop wakes just after the weekly epoch boundary instead of late.
+    """
+    wait = max(
+        poll_interval - work_seconds, seconds_until_chain_check * ADAPTIVE_WAIT_FRACTION
+    )
+    if 0 < seconds_until_chain_check < wait:
+        wait = seconds_until_chain_check
+    wait = min(wait, seconds_until_rollover + EPOCH_ROLLOVER_GRACE_SECONDS)
+    return max(MIN_IDLE_WAIT_SECONDS, wait)
+
+
+def _estimate_block(anchor_block: int, anchor_mono: float, now_mono: float) -> int:
+    """Extrapolate the chain head from the last RPC-observed block at target block time.
+
+    Only used for display: blocks can arrive slower than the target, so decisions
+    that gate a publish still read the real head via ``get_current_block``.
+    """
+    return anchor_block + int(max(0.0, now_mono - anchor_mono) / BLOCK_TIME_SECONDS)
+
+
+def _resolve_validator_uid(
+    hotkey_to_uid: Mapping[str, int], hotkey_ss58: str, previous_uid: int | None
+) -> int | None:
+    """Return the validator's UID in ``hotkey_to_uid``, or None if the hotkey is gone.
+
+    ``previous_uid`` is not kept for a missing hotkey: after a deregistration it may
+    already belong to another neuron, whose ``last_update`` would then drive the tempo
+    cooldown and publish decisions.
+    """
+    uid = hotkey_to_uid.get(hotkey_ss58)
+    if uid is None:
+        _log_warning(
+            "Validator hotkey not in metagraph",
+            f" after sync: {hotkey_ss58} (was uid {previous_uid}). "
+            "Skipping weight publishing until it is registered again.",
+        )
+        return None
+    if uid != previous_uid:
+        bt.logging.info(f"Validator uid changed after metagraph sync: {previous_uid} → {uid}")
+    return uid
+
+
+def _require_validator_uid(
+    hotkey_to_uid: Mapping[str, int], hotkey_ss58: str, netuid: int
+) -> int:
+    """Return the validator's UID from the synced metagraph index.
+
+    Raises:
+        RuntimeError: If the hotkey is not registered on ``netuid``
+    """
+    uid = hotkey_to_uid.get(hotkey_ss58)
+    if uid is None:
+        bt.logging.error(
+            f"Hotkey {hotkey_ss58} is not registered on netuid {netuid}. "
+            "Please register the hotkey before running the validator."
+        )
+        raise RuntimeError(
+            f"Validator not registered: hotkey {hotkey_ss58} not found on netuid {netuid}"
+        )
+    return uid
+
+
+def _validator_last_update(metagraph: Any, validator_uid: int | None) -> int:
+    """Return the validator's last weight-set block from the synced metagraph (0 if unknown)."""
+    last_update = getattr(metagraph, "last_update", None)
+    if last_update is None or validator_uid is None or validator_uid >= len(last_update):
+        return 0
+    return int(last_update[validator_uid])
+
+
+def _select_block_reader(block: Any) -> Callable[[Any], Any]:
+    """Choose, once, how to read a scalar block number off ``metagraph.block``.
+
+    Depending on the bittensor backend the attribute is a plain int or a 0-d
+    numpy/torch array; the type does not change between syncs.
+    """
+    if hasattr(block, "__iter__") and not isinstance(block, str):
+        return lambda metagraph: int(metagraph.block)
+    return operator.attrgetter("block")
+
+
+def _connect_subtensor(network: str | None) -> Any:
+    """Open a subtensor connection to ``network`` (name or endpoint URL), or the default."""
+    if network:
+        return bt.subtensor(network=network)
+    return bt.subtensor()
+
+
+def _ensure_subtensor(subtensor: Any, network: str | None) -> tuple[Any, bool]:
+    """Return a working subtensor, reconnecting if ``subtensor`` no longer answers.
+
+    Pings with ``get_current_block()``; on failure the old websocket is closed and a
+    fresh connection is opened. If reconnecting fails too, the old instance is kept
+    and the next loop error tries again.
+
+    Returns:
+        Tuple of (subtensor, reconnected)
+    """
+    try:
+        subtensor.get_current_block()
+        return subtensor, False
+    except Exception as exc:
+        bt.logging.warning(f"Subtensor connection unhealthy ({exc}); reconnecting")
+    try:
+        subtensor.close()
+    except Exception:  # pragma: no cover - already-dead sockets may refuse to close
+        pass
+    try:
+        return _connect_subtensor(network), True
+    except Exception as exc:
+        bt.logging.warning(f"Subtensor reconnect failed: {exc}")
+        return subtensor, False
+
+
+def _is_programmer_error(exc: BaseException) -> bool:
+    """Return True if ``exc`` is a bug in this package that retrying cannot fix.
+
+    Only ``_PROGRAMMER_ERRORS`` raised from this package's own code count. The same
+    types raised inside bittensor, substrate, websocket or web3 code (e.g. on a
+    dropped connection or a malformed reply) are retried like any other loop error.
+    """
+    if not isinstance(exc, _PROGRAMMER_ERRORS):
+        return False
+    tb = exc.__traceback__
+    if tb is None:
+        return False
+    while tb.tb_next is not None:
+        tb = tb.tb_next
+    return tb.tb_frame.f_code.co_filename.startswith(_PACKAGE_DIR)
+
+
+def _error_backoff_seconds(
+    poll_interval: float, consecutive_failures: int, jitter: float = 0.0
+) -> float:
+    """Return the retry delay after ``consecutive_failures`` loop errors in a row.
+
+    A one-off network blip is retried after a few seconds; a persistent outage backs
+    off exponentially until it settles at the regular ``poll_interval`` cadence.
+    ``jitter`` (a draw in [0, 1)) stretches the delay by up to
+    ``ERROR_BACKOFF_JITTER_FRACTION`` so validators that lost the same endpoint
+    don't all retry in lockstep.
+    """
+    exponent = min(max(consecutive_failures - 1, 0), 16)
+    delay = min(poll_interval, ERROR_BACKOFF_BASE_SECONDS * 2**exponent)
+    return delay * (1.0 + ERROR_BACKOFF_JITTER_FRACTION * jitter)
+
+
+def _weekly_cache_path(log_dir: str, netuid: int) -> Path:
+    """Return where the current weekly epoch's weights are persisted across restarts."""
+    return Path(log_dir) / f"weekly_cache_{netuid}.json"
+
+
+def _save_weekly_cache(
+    path: Path,
+    weekly_epoch_version: str,
+    epoch_version: str,
+    weights: Mapping[int, float],
+    scores: Mapping[int, float],
+) -> None:
+    """Atomically persist the cached weekly weights and scores.
+
+    A failed write only costs the fast restart, so it is logged, never raised.
+    """
+    payload = {
+        "weekly_epoch_version": weekly_epoch_version,
+        "epoch_version": epoch_version,
+        "weights": weights,
+        "scores": scores,
+    }
+    tmp_path = path.with_suffix(".tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(payload))
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        _log_warning("Could not persist weekly weights cache", f": {exc}")
+
+
+def _load_weekly_cache(
+    path: Path, weekly_epoch_version: str
+) -> tuple[dict[int, float], dict[int, float], str] | None:
+    """Load persisted weights and scores if they belong to ``weekly_epoch_version``.
+
+    Returns:
+        Tuple of (weights, scores, epoch_version), or None if the file is missing,
+        unreadable or from another weekly epoch
+    """
+    try:
+        data = json.loads(path.read_text())
+        if data["weekly_epoch_version"] != weekly_epoch_version:
+            return None
+        weights = {int(uid): float(value) for uid, value in data["weights"].items()}
+        scores = {int(uid): float(value) for uid, value in data["scores"].items()}
+        return weights, scores, str(data["epoch_version"])
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        bt.logging.debug(f"Ignoring unreadable weekly weights cache {path}: {exc}")
+        return None
+
+
+def _importable_exceptions(
+    names: tuple[tuple[str, str], ...],
+) -> tuple[type[BaseException], ...]:
+    """Return the exception classes in ``names`` whose modules can be imported."""
+    found: list[type[BaseException]] = []
+    for module_name, attr in names:
+        with contextlib.suppress(ImportError, AttributeError):
+            found.append(getattr(importlib.import_module(module_name), attr))
+    return tuple(found)
+
+
+# Chain read failures worth retrying immediately (connection resets, timeouts, dropped websockets)
+_TRANSIENT_RPC_ERRORS: tuple[type[BaseException], ...] = (
+    ConnectionError,
+    TimeoutError,
+    *_importable_exceptions(_SUBSTRATE_CONNECTION_ERRORS),
+)
+
+_T = TypeVar("_T")
+
+
+def _log_transient_retry(retry_state: tenacity.RetryCallState) -> None:
+    """Log the transient RPC error that is about to be retried."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    delay = retry_state.next_action.sleep if retry_state.next_action else 0.0
+    bt.logging.debug(f"Transient RPC error ({exc!r}); retrying in {delay:.2f}s")
+
+
+@tenacity.retry(
+    stop=tenacity.stop_after_attempt(TRANSIENT_RETRY_ATTEMPTS),
+    wait=tenacity.wait_exponential(
+        multiplier=TRANSIENT_RETRY_BASE_SECONDS, max=TRANSIENT_RETRY_MAX_SECONDS
+    )
+    + tenacity.wait_random(0, TRANSIENT_RETRY_BASE_SECONDS),
+    retry=tenacity.retry_if_exception_type(_TRANSIENT_RPC_ERRORS),
+    before_sleep=_log_transient_retry,
+    reraise=True,
+)
+def _retry_transient(call: Callable[[], _T]) -> _T:
+    """Run a chain read, retrying transient RPC failures with jittered exponential backoff.
+
+    A connection reset, timeout or dropped substrate websocket is retried within
+    about a second instead of failing the iteration and waiting out the loop error
+    backoff. Other exceptions, and the last transient one, propagate to the loop's
+    error handling.
+    """
+    return call()
+
+
+# Set when the daemon should stop
+_stop_event = threading.Event()
+# Set to end the current idle wait early (shutdown request or background epoch finished)
+_wake_event = threading.Event()
+
+
+def _request_stop(signum: int, frame: FrameType | None) -> None:
+    """Signal handler asking the daemon loop to exit after its current step.
+
+    A second SIGINT while already stopping raises KeyboardInterrupt, so Ctrl-C twice
+    still aborts a step that is stuck in network I/O.
+    """
+    if signum == signal.SIGINT and _stop_event.is_set():
+        raise KeyboardInterrupt
+    _stop_event.set()
+    _wake_event.set()
+
+
+def _wake(_future: Future[dict[str, Any]] | None = None) -> None:
+    """End the current idle wait early (usable as a Future done-callback)."""
+    _wake_event.set()
+
+
+def _wait(seconds: float) -> bool:
+    """Idle for up to ``seconds`` or until woken; return True if shutdown was requested."""
+    _wake_event.wait(max(0.0, seconds))
+    _wake_event.clear()
+    return _stop_event.is_set()
+
+
 def _shutdown_handler():
     """Cleanup handler called on exit."""
     bt.logging.info(
@@ -71,20 +499,19 @@ def main() -> None:
     # Pass network directly instead of config (newer bittensor API)
     subtensor_network = getattr(config.subtensor, "network", None)
     subtensor_endpoint = getattr(config.subtensor, "chain_endpoint", None)
-    if subtensor_endpoint:
-        subtensor = bt.subtensor(network=subtensor_endpoint)
-    elif subtensor_network:
-        subtensor = bt.subtensor(network=subtensor_network)
-    else:
-        subtensor = bt.subtensor()
+    # An explicit endpoint wins over the network name; also used for reconnects
+    subtensor_target = subtensor_endpoint or subtensor_network
+    subtensor = _connect_subtensor(subtensor_target)
     bt.logging.info(f"Subtensor: {subtensor}")
+    # Fixed for the process lifetime; shown on every metagraph resync
+    network_name = subtensor_network or subtensor.network
 
-    # Create and sync metagraph (like template does)
-    metagraph = subtensor.metagraph(args.netuid)
+    # Load the metagraph view from a single get_metagraph_info query; later
+    # metagraph.sync() calls refresh it the same way
+    metagraph = load_metagraph(subtensor, args.netuid)
     bt.logging.info(f"Metagraph: {metagraph}")
-
-    # Sync metagraph initially to get latest state
-    metagraph.sync(subtensor=subtensor)
+    # Hotkey→UID index, rebuilt only when a sync changes the hotkeys
+    hotkey_to_uid = index_hotkeys(metagraph.hotkeys)
 
     # Determine hotkey SS58 address and wallet setup
     hotkey_ss58 = getattr(args, "hotkey_ss58", None)
@@ -97,23 +524,8 @@ def main() -> None:
             f"{ANSI_BOLD}{ANSI_CYAN}Using direct hotkey SS58:{ANSI_RESET} {hotkey_ss58}"
         )
         
-        # Check if hotkey is registered on subnet
-        is_registered = subtensor.is_hotkey_registered_on_subnet(
-            hotkey_ss58=hotkey_ss58,
-            netuid=args.netuid,
-        )
-        
-        if not is_registered:
-            bt.logging.error(
-                f"Hotkey {hotkey_ss58} is not registered on netuid {args.netuid}. "
-                "Please register the hotkey before running the validator."
-            )
-            raise RuntimeError(
-                f"Validator not registered: hotkey {hotkey_ss58} not found on netuid {args.netuid}"
-            )
-        
-        # Get the UID for this hotkey from metagraph
-        validator_uid = metagraph.hotkeys.index(hotkey_ss58)
+        # Registered hotkeys are exactly those in the synced metagraph
+        validator_uid: int | None = _require_validator_uid(hotkey_to_uid, hotkey_ss58, args.netuid)
         
         # Check if this hotkey is the subnet owner's hotkey
         # metagraph.owner_hotkey contains the subnet owner's hotkey SS58 address
@@ -139,8 +551,6 @@ def main() -> None:
         # If subnet owner is verified, try to find wallet for weight publishing
         if is_subnet_owner and args.wallet_name:
             # Not subnet owner but wallet provided - try to find matching hotkey
-            from pathlib import Path
-            
             wallet_path = Path(config.wallet.path).expanduser() / config.wallet.name / "hotkeys"
             
             if args.wallet_hotkey:
@@ -242,21 +652,10 @@ def main() -> None:
 
     # Check if validator is registered (for non-SS58 path, already checked above for SS58 path)
     if not getattr(args, "hotkey_ss58", None):
-        is_registered = subtensor.is_hotkey_registered_on_subnet(
-            hotkey_ss58=hotkey_ss58,
-            netuid=args.netuid,
-        )
-        
-        if not is_registered:
-            bt.logging.error(
-                f"Hotkey {hotkey_ss58} is not registered on netuid {args.netuid}. "
-                "Please register the hotkey before running the validator."
-            )
-            raise RuntimeError(
-                f"Validator not registered: hotkey {hotkey_ss58} not found on netuid {args.netuid}"
-            )
-
-    validator_uid = metagraph.hotkeys.index(hotkey_ss58)
+        validator_uid = _require_validator_uid(hotkey_to_uid, hotkey_ss58, args.netuid)
+    # Hotkeys validator_uid and hotkey_to_uid were derived from; only re-derive when a
+    # sync changes them
+    synced_hotkeys = tuple(metagraph.hotkeys)
 
     bt.logging.info(
         f"{ANSI_BOLD}{ANSI_GREEN}{EMOJI_NETWORK} Running validator{ANSI_RESET} "
@@ -297,6 +696,7 @@ def main() -> None:
             "netuid": args.netuid,
             "timeout": args.timeout,
             "poll_interval": args.poll_interval,
+            "replay_concurrency": args.replay_concurrency,
             "log_dir": args.log_dir,
             "parent_vault_address": parent_vault_address,
             "parent_vault_rpc_url": parent_vault_rpc_url,
@@ -320,24 +720,40 @@ def main() -> None:
             f"{ANSI_BOLD}{ANSI_YELLOW}⚠ Leaderboard API{ANSI_RESET} - Disabled"
         )
 
+    # One keep-alive connection pool each to the verifier and leaderboard for the whole process
+    verifier_client = httpx.Client(base_url=args.verifier_url, timeout=args.timeout)
+    leaderboard_client = httpx.Client(timeout=LEADERBOARD_TIMEOUT_SECONDS)
+
+    # Everything but the epoch version and force flag is fixed for the process lifetime
+    run_epoch_for = functools.partial(
+        run_epoch,
+        verifier_url=args.verifier_url,
+        settings=settings,
+        timeout=args.timeout,
+        dry_run=args.dry_run,
+        use_verified_amounts=args.use_verified_amounts,
+        subtensor=subtensor,
+        wallet=wallet,
+        metagraph=metagraph,
+        validator_uid=validator_uid,
+        args=args,
+        hotkey_ss58=hotkey_ss58,
+        http_client=verifier_client,
+        hotkey_to_uid=hotkey_to_uid,
+        leaderboard_client=leaderboard_client,
+    )
+
     if args.run_once:
         # Single run mode - always force weights on startup
         epoch_version = _epoch_version(args.epoch)
-        run_epoch(
-            verifier_url=args.verifier_url,
-            epoch_version=epoch_version,
-            settings=settings,
-            timeout=args.timeout,
-            dry_run=args.dry_run,
-            use_verified_amounts=args.use_verified_amounts,
-            subtensor=subtensor,
-            wallet=wallet,
-            metagraph=metagraph,
-            validator_uid=validator_uid,
-            args=args,
-            force=True,  # Always force weights in single-run mode
-            hotkey_ss58=hotkey_ss58,
-        )
+        try:
+            run_epoch_for(
+                epoch_version=epoch_version,
+                force=True,  # Always force weights in single-run mode
+            )
+        finally:
+            verifier_client.close()
+            leaderboard_client.close()
     else:
         # Continuous daemon mode
         bt.logging.info(
@@ -346,286 +762,426 @@ def main() -> None:
         )
         # Track weekly epoch (Friday 00:00 UTC → Thursday 23:59 UTC)
         last_weekly_epoch_version = None
+        # Integer index of the weekly epoch above; the per-poll rollover check compares these
+        last_weekly_epoch_index: int | None = None
         cached_weights: dict[int, float] | None = None
         cached_scores: dict[int, float] | None = None
         cached_epoch_version: str | None = None
+        current_weekly_epoch_version: str | None = None
 
         step = 0
-        last_metagraph_sync = 0
-        metagraph_sync_interval = settings.metagraph_sync_interval
         last_weight_publish_block = 0
+        next_chain_check = 0.0  # time.monotonic() deadline for the next chain check
+        last_heartbeat = 0.0
+        rollover_deadline = 0.0  # time.monotonic() at which the weekly epoch ends
+        last_trace_ts = float("-inf")
+        last_exc_type: type[BaseException] | None = None
+        consecutive_failures = 0
+        # The weekly run_epoch runs on a worker thread so shutdown stays responsive
+        epoch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="epoch")
+        pending_epoch: Future[dict[str, Any]] | None = None
+        pending_epoch_version: str | None = None
+        pending_epoch_index: int | None = None
+        pending_epoch_block = 0
+
+        # A restart mid-week reuses the weights persisted for the current weekly epoch
+        # instead of re-fetching the frozen list; the next tempo refresh updates them
+        weekly_cache_path = _weekly_cache_path(settings.log_dir, args.netuid)
+        now_ts = time.time()
+        restored_index = epoch_index_at(now_ts)
+        restored_version = epoch_meta(restored_index)[2]
+        restored = None if args.dry_run else _load_weekly_cache(weekly_cache_path, restored_version)
+        if restored is not None:
+            cached_weights, cached_scores, cached_epoch_version = restored
+            last_weekly_epoch_index = restored_index
+            last_weekly_epoch_version = restored_version
+            rollover_deadline = time.monotonic() + epoch_start_ts(restored_index + 1) - now_ts
+            _log_success(
+                "Restored cached weights",
+                f" for weekly epoch {restored_version} ({len(cached_weights)} miners)",
+            )
 
         current_block = subtensor.get_current_block()
+        current_block_mono = time.monotonic()  # when current_block was read
         bt.logging.info(
             f"{ANSI_BOLD}{ANSI_CYAN}{EMOJI_BLOCK} Validator starting{ANSI_RESET} "
             f"at block: {ANSI_BOLD}{current_block}{ANSI_RESET}"
         )
 
-        # Get Bittensor epoch length (tempo) from metagraph
-        metagraph.sync(subtensor=subtensor)
+        # Get Bittensor epoch length (tempo) from the metagraph synced at startup
         bittensor_epoch_length = getattr(
             metagraph, "tempo", settings.default_tempo
         )  # Default to settings.default_tempo if not available
+        metagraph_sync_interval = _metagraph_sync_interval(
+            bittensor_epoch_length, settings.metagraph_sync_interval
+        )
+        read_block = _select_block_reader(metagraph.block)
+        # The startup sync counts as the first periodic sync
+        last_metagraph_sync = read_block(metagraph)
+        # metagraph.last_update only changes on sync, so read it once per sync
+        validator_last_update = _validator_last_update(metagraph, validator_uid)
         bt.logging.info(
             f"{ANSI_BOLD}{ANSI_CYAN}{EMOJI_GEAR} Bittensor epoch length (tempo):{ANSI_RESET} "
             f"{ANSI_BOLD}{bittensor_epoch_length}{ANSI_RESET} blocks"
         )
 
-        while True:
-            try:
-                current_block = subtensor.get_current_block()
+        # SIGTERM (e.g. from a process manager) and Ctrl-C wake the idle wait instead
+        # of waiting out the remaining poll interval
+        signal.signal(signal.SIGTERM, _request_stop)
+        signal.signal(signal.SIGINT, _request_stop)
 
-                # Sync metagraph periodically
-                if current_block - last_metagraph_sync >= metagraph_sync_interval:
-                    bt.logging.info(
-                        f"{ANSI_BOLD}{ANSI_CYAN}{EMOJI_NETWORK} resync_metagraph(){ANSI_RESET}"
-                    )
-                    metagraph.sync(subtensor=subtensor)
-                    last_metagraph_sync = current_block
-                    # Update tempo in case it changed
-                    new_tempo = getattr(metagraph, "tempo", settings.default_tempo)
-                    if new_tempo != bittensor_epoch_length:
-                        bt.logging.info(
-                            f"{ANSI_BOLD}{ANSI_YELLOW} Tempo changed:{ANSI_RESET} "
-                            f"{bittensor_epoch_length} → {new_tempo}"
-                        )
-                        bittensor_epoch_length = new_tempo
-                    network_name = (
-                        config.subtensor.network
-                        if hasattr(config.subtensor, "network")
-                        else subtensor.network
-                    )
-                    # Convert block to scalar if it's an array
-                    block_val = (
-                        int(metagraph.block)
-                        if hasattr(metagraph.block, "__iter__")
-                        and not isinstance(metagraph.block, str)
-                        else metagraph.block
-                    )
-                    bt.logging.info(
-                        f"{ANSI_BOLD}{ANSI_GREEN}{EMOJI_SUCCESS} Metagraph updated{ANSI_RESET} "
-                        f"metagraph(netuid:{ANSI_BOLD}{args.netuid}{ANSI_RESET}, "
-                        f"n:{ANSI_BOLD}{metagraph.n}{ANSI_RESET}, "
-                        f"block:{ANSI_BOLD}{block_val}{ANSI_RESET}, "
-                        f"tempo:{ANSI_BOLD}{bittensor_epoch_length}{ANSI_RESET}, "
-                        f"network:{ANSI_BOLD}{network_name}{ANSI_RESET})"
-                    )
+        # Ctrl-C normally just sets the stop event (see _request_stop); a second Ctrl-C
+        # raises KeyboardInterrupt, handled once here rather than on every iteration
+        try:
+            while not _stop_event.is_set():
+                tick_start = time.monotonic()
+                try:
+                    # The weekly run_epoch is in flight on the worker thread; the subtensor
+                    # connection is not thread-safe, so stay off the chain until it finishes
+                    if pending_epoch is not None:
+                        if not pending_epoch.done():
+                            if _wait(args.poll_interval):
+                                break
+                            continue
+                        future, pending_epoch = pending_epoch, None
+                        result = future.result()
 
-                # Check current weekly epoch (Friday 00:00 UTC → Thursday 23:59 UTC)
-                current_epoch_start = epoch_start()
-                current_weekly_epoch_version = current_epoch_start.strftime(
-                    "%Y-%m-%dT%H:%M:%SZ"
-                )
-                
-                # Check if this is a new weekly epoch or a restart - fetch frozen list and calculate weights
-                if last_weekly_epoch_version != current_weekly_epoch_version:
-                    # This could be:
-                    # 1. A new weekly epoch (Friday 00:00 UTC)
-                    # 2. A validator restart during an ongoing weekly epoch
-                    # In both cases, we need to fetch the frozen list for the current weekly epoch
-                    if last_weekly_epoch_version is None:
-                        # Validator restart - fetch frozen list for current weekly epoch
-                        bt.logging.info(
-                            f"{ANSI_BOLD}{ANSI_CYAN}{EMOJI_ROCKET} Validator restart detected{ANSI_RESET} "
-                            f"during weekly epoch {ANSI_BOLD}{current_weekly_epoch_version}{ANSI_RESET}. "
-                            f"{ANSI_DIM}Fetching frozen epoch list...{ANSI_RESET}"
-                        )
-                    else:
-                        # New weekly epoch transition
-                        bt.logging.info(
-                            f"{ANSI_BOLD}{ANSI_MAGENTA}{EMOJI_COIN} New weekly epoch detected:{ANSI_RESET} "
-                            f"{ANSI_BOLD}{current_weekly_epoch_version}{ANSI_RESET} "
-                            f"{ANSI_DIM}(previous: {last_weekly_epoch_version}){ANSI_RESET}"
-                        )
-                    bt.logging.info(
-                        f"{ANSI_DIM}step({step}) block({current_block}){ANSI_RESET}"
-                    )
+                        # Cache the weights and scores for this weekly epoch
+                        # Note: We'll refresh these every Bittensor epoch to catch mid-day changes
+                        # Note: epoch_version may have been updated if verifier returned a fallback epoch
+                        cached_weights = result.get("weights", {})
+                        cached_scores = result.get("scores", {})
+                        # Use the actual epoch version returned by verifier (may be different if fallback occurred)
+                        cached_epoch_version = result.get("epoch_version", pending_epoch_version)
+                        if not args.dry_run:
+                            _save_weekly_cache(
+                                weekly_cache_path,
+                                pending_epoch_version,
+                                cached_epoch_version,
+                                cached_weights,
+                                cached_scores,
+                            )
 
-                    # Fetch frozen epoch list and calculate weights for this weekly epoch
-                    # This will also publish weights once (via run_epoch -> process_entries -> publish)
-                    # Force weights on startup (when last_weekly_epoch_version is None) to ensure
-                    # validator always sets weights when it starts, bypassing cooldown checks
-                    is_startup = last_weekly_epoch_version is None
-                    
-                    result = run_epoch(
-                        verifier_url=args.verifier_url,
-                        epoch_version=current_weekly_epoch_version,
-                        settings=settings,
-                        timeout=args.timeout,
-                        dry_run=args.dry_run,
-                        use_verified_amounts=args.use_verified_amounts,
-                        subtensor=subtensor,
-                        wallet=wallet,
-                        metagraph=metagraph,
-                        validator_uid=validator_uid,
-                        args=args,
-                        force=is_startup,  # Force on startup
-                        hotkey_ss58=hotkey_ss58,
-                    )
+                        # Track the weekly epoch we're in (not necessarily the frozen epoch version)
+                        if last_weekly_epoch_index != pending_epoch_index:
+                            last_weekly_epoch_index = pending_epoch_index
+                            last_weekly_epoch_version = pending_epoch_version
+                            last_weight_publish_block = pending_epoch_block
+                            step += 1
+                            _log_success(
+                                "Weekly epoch weights calculated and cached",
+                                _EPOCH_CACHED_FMT
+                                % (pending_epoch_version, bittensor_epoch_length),
+                            )
 
-                    # Cache the weights and scores for this weekly epoch
-                    # Note: We'll refresh these every Bittensor epoch to catch mid-day changes
-                    # Note: epoch_version may have been updated if verifier returned a fallback epoch
-                    cached_weights = result.get("weights", {})
-                    cached_scores = result.get("scores", {})
-                    # Use the actual epoch version returned by verifier (may be different if fallback occurred)
-                    cached_epoch_version = result.get(
-                        "epoch_version", current_weekly_epoch_version
-                    )
-                    
-                    # Track the weekly epoch we're in (not necessarily the frozen epoch version)
-                    if last_weekly_epoch_version != current_weekly_epoch_version:
-                        last_weekly_epoch_version = current_weekly_epoch_version
-                        last_weight_publish_block = current_block
-                        step += 1
-                        bt.logging.info(
-                            f"{ANSI_BOLD}{ANSI_GREEN}{EMOJI_SUCCESS} Weekly epoch weights calculated and cached{ANSI_RESET} "
-                            f"{ANSI_BOLD}{current_weekly_epoch_version}{ANSI_RESET}. "
-                            f"{ANSI_DIM}Will refresh list and publish weights every Bittensor epoch (~{bittensor_epoch_length} blocks) throughout the week.{ANSI_RESET}"
+                    # Check current weekly epoch (Friday 00:00 UTC → Thursday 23:59 UTC)
+                    # Boundaries and version string are cached per integer epoch index
+                    now_ts = time.time()
+                    current_epoch_index = epoch_index_at(now_ts)
+                    _, _, current_weekly_epoch_version = epoch_meta(current_epoch_index)
+                    new_weekly_epoch = last_weekly_epoch_index != current_epoch_index
+                    if new_weekly_epoch:
+                        # Convert the wall-clock rollover into a monotonic deadline once, so the
+                        # idle wait is immune to NTP steps and needs no datetime arithmetic
+                        rollover_deadline = (
+                            time.monotonic() + epoch_start_ts(current_epoch_index + 1) - now_ts
                         )
-                else:
-                    # Same weekly epoch - check if we need to publish cached weights for this Bittensor epoch
-                    if (
-                        cached_weights is not None
-                        and cached_scores is not None
-                        and cached_epoch_version is not None
-                    ):
-                        # Check if enough blocks have passed since last weight update (Bittensor epoch)
-                        should_publish = False
-                        blocks_since_update = 0
-
-                        if metagraph is not None and validator_uid is not None:
-                            last_update = (
-                                metagraph.last_update[validator_uid]
-                                if hasattr(metagraph, "last_update")
-                                and validator_uid < len(metagraph.last_update)
-                                else 0
-                            )
-                            blocks_since_update = current_block - last_update
 
-                            # Publish weights if Bittensor epoch has passed (tempo blocks)
-                            if blocks_since_update >= bittensor_epoch_length:
-                                should_publish = True
-                        else:
-                            # Fallback: check blocks since last publish
-                            blocks_since_last_publish = (
-                                current_block - last_weight_publish_block
+                    # Inside a weekly epoch, skip chain I/O until the next Bittensor epoch can
+                    # possibly have been reached (tracked via next_chain_check).
+                    chain_check_due = new_weekly_epoch or time.monotonic() >= next_chain_check
+                    if chain_check_due:
+                        current_block = _retry_transient(subtensor.get_current_block)
+                        current_block_mono = time.monotonic()
+
+                        # Sync metagraph periodically
+                        if current_block - last_metagraph_sync >= metagraph_sync_interval:
+                            if is_enabled_for(logging.INFO):
+                                bt.logging.info(_RESYNC_MSG)
+                            _retry_transient(functools.partial(metagraph.sync, subtensor=subtensor))
+                            last_metagraph_sync = current_block
+                            hotkeys = tuple(metagraph.hotkeys)
+                            if hotkeys != synced_hotkeys:
+                                synced_hotkeys = hotkeys
+                                hotkey_to_uid = index_hotkeys(hotkeys)
+                                validator_uid = _resolve_validator_uid(
+                                    hotkey_to_uid, hotkey_ss58, validator_uid
+                                )
+                                run_epoch_for = functools.partial(
+                                    run_epoch_for,
+                                    validator_uid=validator_uid,
+                                    hotkey_to_uid=hotkey_to_uid,
+                                    # Score but do not publish while unregistered
+                                    dry_run=args.dry_run or validator_uid is None,
+                                )
+                            validator_last_update = _validator_last_update(
+                                metagraph, validator_uid
                             )
-                            if blocks_since_last_publish >= bittensor_epoch_length:
-                                should_publish = True
-                                blocks_since_update = blocks_since_last_publish
+                            # Update tempo in case it changed
+                            new_tempo = getattr(metagraph, "tempo", settings.default_tempo)
+                            if new_tempo != bittensor_epoch_length:
+                                bt.logging.info(
+                                    _TEMPO_CHANGED_FMT % (bittensor_epoch_length, new_tempo)
+                                )
+                                bittensor_epoch_length = new_tempo
+                                metagraph_sync_interval = _metagraph_sync_interval(
+                                    new_tempo, settings.metagraph_sync_interval
+                                )
+                            if is_enabled_for(logging.INFO):
+                                bt.logging.info(
+                                    _METAGRAPH_UPDATED_TEMPLATE.format_map(
+                                        {
+                                            "netuid": args.netuid,
+                                            "n": metagraph.n,
+                                            "block": read_block(metagraph),
+                                            "tempo": bittensor_epoch_length,
+                                            "network": network_name,
+                                        }
+                                    )
+                                )
 
-                        if should_publish:
+                    # Check if this is a new weekly epoch or a restart - fetch frozen list and calculate weights
+                    if new_weekly_epoch:
+                        # This could be:
+                        # 1. A new weekly epoch (Friday 00:00 UTC)
+                        # 2. A validator restart during an ongoing weekly epoch
+                        # In both cases, we need to fetch the frozen list for the current weekly epoch
+                        if last_weekly_epoch_version is None:
+                            # Validator restart - fetch frozen list for current weekly epoch
+                            bt.logging.info(_RESTART_DETECTED_FMT % current_weekly_epoch_version)
+                        else:
+                            # New weekly epoch transition
                             bt.logging.info(
-                                f"{ANSI_BOLD}{ANSI_CYAN}{EMOJI_ROCKET} Bittensor epoch reached{ANSI_RESET} "
-                                f"for weekly epoch {ANSI_BOLD}{cached_epoch_version}{ANSI_RESET} "
-                                f"{ANSI_DIM}({blocks_since_update}/{bittensor_epoch_length} blocks). "
-                                f"Refreshing verified miners list to check for mid-day changes...{ANSI_RESET}"
+                                _NEW_EPOCH_FMT
+                                % (current_weekly_epoch_version, last_weekly_epoch_version)
                             )
+                        bt.logging.info(_STEP_FMT % (step, current_block))
 
-                            # Refresh the verified miners list every Bittensor epoch to catch mid-day
-                            # deregistrations, releases, and expirations
-                            try:
-                                result = run_epoch(
-                                    verifier_url=args.verifier_url,
-                                    epoch_version=current_weekly_epoch_version,
-                                    settings=settings,
-                                    timeout=args.timeout,
-                                    dry_run=args.dry_run,
-                                    use_verified_amounts=args.use_verified_amounts,
-                                    subtensor=subtensor,
-                                    wallet=wallet,
-                                    metagraph=metagraph,
-                                    validator_uid=validator_uid,
-                                    args=args,
-                                    force=True,  # Force refresh to get latest state
-                                    hotkey_ss58=hotkey_ss58,
-                                )
-                                
-                                # Update cached weights and scores with latest state
-                                cached_weights = result.get("weights", {})
-                                cached_scores = result.get("scores", {})
-                                cached_epoch_version = result.get(
-                                    "epoch_version", current_weekly_epoch_version
+                        # Fetch frozen epoch list and calculate weights for this weekly epoch
+                        # This will also publish weights once (via run_epoch -> process_entries -> publish)
+                        # Force weights on startup (when last_weekly_epoch_version is None) to ensure
+                        # validator always sets weights when it starts, bypassing cooldown checks
+                        is_startup = last_weekly_epoch_version is None
+
+                        pending_epoch = epoch_pool.submit(
+                            run_epoch_for,
+                            epoch_version=current_weekly_epoch_version,
+                            force=is_startup,  # Force on startup
+                        )
+                        pending_epoch.add_done_callback(_wake)
+                        pending_epoch_version = current_weekly_epoch_version
+                        pending_epoch_index = current_epoch_index
+                        pending_epoch_block = current_block
+                    else:
+                        # Same weekly epoch - check if we need to publish cached weights for this Bittensor epoch
+                        if chain_check_due:
+                            if validator_uid is None:
+                                # Nothing is published until a resync finds the hotkey again
+                                if is_enabled_for(logging.DEBUG):
+                                    bt.logging.debug(_UID_MISSING_FMT % cached_epoch_version)
+                                next_chain_check = (
+                                    time.monotonic()
+                                    + metagraph_sync_interval * BLOCK_TIME_SECONDS
                                 )
-                                
-                                expired_count = result.get("summary", {}).get("expired_pools", 0)
-                                if expired_count > 0:
+                            elif (
+                                cached_weights is not None
+                                and cached_scores is not None
+                                and cached_epoch_version is not None
+                            ):
+                                # Check if enough blocks have passed since last weight update (Bittensor epoch)
+                                should_publish = False
+                                blocks_since_update = 0
+
+                                if metagraph is not None and validator_uid is not None:
+                                    blocks_since_update = current_block - validator_last_update
+
+                                    # Publish weights if Bittensor epoch has passed (tempo blocks)
+                                    if blocks_since_update >= bittensor_epoch_length:
+                                        should_publish = True
+                                else:
+                                    # Fallback: check blocks since last publish
+                                    blocks_since_last_publish = (
+                                        current_block - last_weight_publish_block
+                                    )
+                                    if blocks_since_last_publish >= bittensor_epoch_length:
+                                        should_publish = True
+                                        blocks_since_update = blocks_since_last_publish
+
+                                if should_publish:
                                     bt.logging.info(
-                                        f"{ANSI_BOLD}{ANSI_YELLOW} Mid-day changes detected{ANSI_RESET}: "
-                                        f"{expired_count} expired/released/deregistered pools filtered"
+                                        _BITTENSOR_EPOCH_FMT
+                                        % (
+                                            cached_epoch_version,
+                                            blocks_since_update,
+                                            bittensor_epoch_length,
+                                        )
                                     )
-                            except Exception as exc:
-                                bt.logging.warning(
-                                    f"{ANSI_BOLD}{ANSI_YELLOW}{EMOJI_WARNING} Failed to refresh verified miners list{ANSI_RESET}: {exc}. "
-                                    f"{ANSI_DIM}Using cached weights from last successful refresh.{ANSI_RESET}"
-                                )
-                                # Continue with cached weights if refresh fails
 
-                            # Publish the updated weights
-                            published_weights = publish(
-                                cached_scores,
-                                epoch_version=cached_epoch_version,
-                                settings=settings,
-                                subtensor=subtensor,
-                                wallet=wallet,
-                                metagraph=metagraph,
-                                validator_uid=validator_uid,
-                            )
+                                    # Refresh the verified miners list every Bittensor epoch to catch mid-day
+                                    # deregistrations, releases, and expirations
+                                    try:
+                                        result = run_epoch_for(
+                                            epoch_version=current_weekly_epoch_version,
+                                            force=True,  # Force refresh to get latest state
+                                        )
+                                
+                                        # Update cached weights and scores with latest state
+                                        cached_weights = result.get("weights", {})
+                                        cached_scores = result.get("scores", {})
+                                        cached_epoch_version = result.get(
+                                            "epoch_version", current_weekly_epoch_version
+                                        )
+                                        if not args.dry_run:
+                                            _save_weekly_cache(
+                                                weekly_cache_path,
+                                                current_weekly_epoch_version,
+                                                cached_epoch_version,
+                                                cached_weights,
+                                                cached_scores,
+                                            )
+                                
+                                        expired_count = result.get("summary", {}).get("expired_pools", 0)
+                                        if expired_count > 0:
+                                            bt.logging.info(_MID_DAY_CHANGES_FMT % expired_count)
+                                    except Exception as exc:
+                                        _log_warning(
+                                            "Failed to refresh verified miners list",
+                                            ": %s. %sUsing cached weights from last successful refresh.%s"
+                                            % (exc, ANSI_DIM, ANSI_RESET),
+                                        )
+                                        # Continue with cached weights if refresh fails
 
-                            if published_weights:
-                                last_weight_publish_block = current_block
-                                bt.logging.info(
-                                    f"{ANSI_BOLD}{ANSI_GREEN}{EMOJI_SUCCESS} Weights published{ANSI_RESET} "
-                                    f"{ANSI_DIM}({len(published_weights)} miners, weekly epoch {cached_epoch_version}){ANSI_RESET}"
+                                    # Publish the updated weights
+                                    published_weights = publish(
+                                        cached_scores,
+                                        epoch_version=cached_epoch_version,
+                                        settings=settings,
+                                        subtensor=subtensor,
+                                        wallet=wallet,
+                                        metagraph=metagraph,
+                                        validator_uid=validator_uid,
+                                    )
+
+                                    if published_weights:
+                                        last_weight_publish_block = current_block
+                                        # The next tempo cannot start for a full tempo of
+                                        # blocks; the idle wait thins out until then
+                                        next_chain_check = (
+                                            time.monotonic()
+                                            + bittensor_epoch_length * BLOCK_TIME_SECONDS
+                                        )
+                                        _log_success(
+                                            "Weights published",
+                                            _WEIGHTS_PUBLISHED_FMT
+                                            % (len(published_weights), cached_epoch_version),
+                                        )
+                                else:
+                                    if is_enabled_for(logging.DEBUG):
+                                        bt.logging.debug(
+                                            _WAITING_FMT
+                                            % (
+                                                blocks_since_update,
+                                                bittensor_epoch_length,
+                                                cached_epoch_version,
+                                            )
+                                        )
+                                    # Blocks cannot arrive faster than the target block time, so
+                                    # there is nothing to check on-chain until then
+                                    blocks_remaining = bittensor_epoch_length - blocks_since_update
+                                    next_chain_check = (
+                                        time.monotonic() + blocks_remaining * BLOCK_TIME_SECONDS
+                                    )
+                            else:
+                                # No cached weights yet - this shouldn't happen but log it
+                                _log_warning(
+                                    "No cached weights available",
+                                    " for weekly epoch %s. %sWill fetch on next check.%s"
+                                    % (current_weekly_epoch_version, ANSI_DIM, ANSI_RESET),
                                 )
-                        else:
+
+                        # Wait before next check, waking early for the weekly epoch rollover
+                        now_mono = time.monotonic()
+                        wait_seconds = _idle_wait_seconds(
+                            args.poll_interval,
+                            rollover_deadline - now_mono,
+                            next_chain_check - now_mono,
+                            work_seconds=now_mono - tick_start,
+                        )
+                        if (
+                            now_mono - last_heartbeat >= HEARTBEAT_INTERVAL_SECONDS
+                            and is_enabled_for(logging.DEBUG)
+                        ):
+                            last_heartbeat = now_mono
                             bt.logging.debug(
-                                f"{ANSI_DIM}Waiting for Bittensor epoch: {blocks_since_update}/{bittensor_epoch_length} blocks "
-                                f"(weekly epoch: {cached_epoch_version}){ANSI_RESET}"
+                                _HEARTBEAT_FMT
+                                % (
+                                    current_weekly_epoch_version,
+                                    _estimate_block(current_block, current_block_mono, now_mono),
+                                    wait_seconds,
+                                )
                             )
+                        if _wait(wait_seconds):
+                            break
+
+                    consecutive_failures = 0
+
+                except Exception as exc:
+                    if _is_programmer_error(exc):
+                        bt.logging.error(
+                            f"{ANSI_BOLD}{ANSI_RED}[VALIDATOR LOOP ERROR]{ANSI_RESET} "
+                            f"Unrecoverable error in validator main loop; exiting."
+                        )
+                        raise
+                    consecutive_failures += 1
+                    # A flapping dependency raises the same error every poll; only attach the
+                    # full traceback when the error type changes or once per interval
+                    now_mono = time.monotonic()
+                    if (
+                        type(exc) is last_exc_type
+                        and now_mono - last_trace_ts < TRACEBACK_LOG_INTERVAL_SECONDS
+                    ):
+                        bt.logging.error(
+                            f"{ANSI_BOLD}{ANSI_RED}[VALIDATOR LOOP ERROR]{ANSI_RESET} "
+                            f"{type(exc).__name__}: {exc} {ANSI_DIM}(repeated){ANSI_RESET}"
+                        )
                     else:
-                        # No cached weights yet - this shouldn't happen but log it
-                        bt.logging.warning(
-                            f"{ANSI_BOLD}{ANSI_YELLOW}{EMOJI_WARNING} No cached weights available{ANSI_RESET} "
-                            f"for weekly epoch {current_weekly_epoch_version}. "
-                            f"{ANSI_DIM}Will fetch on next check.{ANSI_RESET}"
+                        last_exc_type = type(exc)
+                        last_trace_ts = now_mono
+                        bt.logging.error(
+                            f"{ANSI_BOLD}{ANSI_RED}[VALIDATOR LOOP ERROR]{ANSI_RESET} "
+                            f"Unexpected error in validator main loop\n"
+                            f"Error type: {type(exc).__name__}\n"
+                            f"Error message: {exc}\n"
+                            f"Current block: {current_block}\n"
+                            f"Weekly epoch: {current_weekly_epoch_version or 'N/A'}\n"
+                            f"Cached epoch: {cached_epoch_version or 'N/A'}",
+                            exc_info=exc,
                         )
-
-                    # Wait before next check
-                    bt.logging.debug(
-                        f"{ANSI_DIM}Validator running... weekly epoch: {current_weekly_epoch_version}, "
-                        f"block: {current_block}{ANSI_RESET}"
+                    # A dropped websocket would fail every retry; rebuild it before backing off
+                    subtensor, reconnected = _ensure_subtensor(subtensor, subtensor_target)
+                    if reconnected:
+                        run_epoch_for = functools.partial(run_epoch_for, subtensor=subtensor)
+                    backoff = _error_backoff_seconds(
+                        args.poll_interval, consecutive_failures, jitter=random.random()
                     )
-                    time.sleep(args.poll_interval)
-
-            except KeyboardInterrupt:
-                bt.logging.info(
-                    f"{ANSI_BOLD}{ANSI_YELLOW}{EMOJI_WARNING} Validator killed{ANSI_RESET} "
-                    f"by keyboard interrupt."
-                )
-                break
-            except Exception as exc:
-                import traceback
-
-                bt.logging.error(
-                    f"{ANSI_BOLD}{ANSI_RED}[VALIDATOR LOOP ERROR]{ANSI_RESET} "
-                    f"Unexpected error in validator main loop"
-                )
-                bt.logging.error(f"Error type: {type(exc).__name__}")
-                bt.logging.error(f"Error message: {str(exc)}")
-                bt.logging.error(
-                    f"Current block: {current_block if 'current_block' in locals() else 'N/A'}"
-                )
-                bt.logging.error(
-                    f"Weekly epoch: {current_weekly_epoch_version if 'current_weekly_epoch_version' in locals() else 'N/A'}"
-                )
-                bt.logging.error(
-                    f"Cached epoch: {cached_epoch_version if 'cached_epoch_version' in locals() else 'N/A'}"
-                )
-                bt.logging.error(f"Traceback:\n{traceback.format_exc()}")
-                bt.logging.info(f"Retrying in {args.poll_interval} seconds...")
-                time.sleep(args.poll_interval)
+                    bt.logging.info(f"Retrying in {backoff:.0f} seconds...")
+                    next_chain_check = 0.0
+                    if _wait(backoff):
+                        break
+        except KeyboardInterrupt:
+            bt.logging.info(
+                _WARNING_PREFIX + "Validator killed" + ANSI_RESET + " by keyboard interrupt."
+            )
+        else:
+            bt.logging.info(
+                _WARNING_PREFIX + "Validator stopped" + ANSI_RESET + " by shutdown signal."
+            )
+        finally:
+            # Let an in-flight run_epoch finish its step (a second Ctrl-C aborts it), but
+            # start nothing new; only then are the shared HTTP clients safe to close
+            epoch_pool.shutdown(wait=True, cancel_futures=True)
+            verifier_client.close()
+            leaderboard_client.close()
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,122 @@
+"""Lightweight metagraph view backed by ``subtensor.get_metagraph_info``."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+import bittensor as bt
+
+# ``SelectiveMetagraphIndex`` members for the fields the snapshot keeps; every other
+# per-neuron vector (stakes, axons, emissions, ...) is left out of the query
+_SNAPSHOT_FIELDS = ("Block", "Tempo", "OwnerHotkey", "Hotkeys", "LastUpdate")
+
+
+def _snapshot_field_indices() -> list[Any] | None:
+    """Return the selective-query indices for the snapshot fields (None if unsupported)."""
+    index_enum = getattr(bt, "SelectiveMetagraphIndex", None)
+    if index_enum is None:
+        return None
+    try:
+        return [getattr(index_enum, name) for name in _SNAPSHOT_FIELDS]
+    except AttributeError:
+        return None
+
+
+class MetagraphSnapshot:
+    """The subset of ``bt.metagraph`` state the validator reads.
+
+    ``subtensor.metagraph()`` and ``metagraph.sync()`` walk every neuron's storage
+    over RPC. The validator only needs hotkeys, ``last_update``, the block, tempo
+    and the subnet owner hotkey, which a single ``get_metagraph_info`` query
+    returns. Where the installed bittensor supports field selection, the query is
+    limited to those fields, so a resync transfers two per-neuron vectors instead
+    of the full subnet state. ``sync()`` keeps the ``bt.metagraph`` call signature
+    so existing call sites refresh the snapshot unchanged.
+    """
+
+    def __init__(self, netuid: int) -> None:
+        self.netuid = netuid
+        self._field_indices = _snapshot_field_indices()
+        self.hotkeys: list[str] = []
+        self.last_update: list[int] = []
+        self.block = 0
+        self.tempo = 0
+        self.owner_hotkey: str | None = None
+
+    @property
+    def n(self) -> int:
+        """Number of registered neurons."""
+        return len(self.hotkeys)
+
+    def sync(self, subtensor: Any, block: int | None = None) -> None:
+        """Refresh the snapshot from one ``get_metagraph_info`` query.
+
+        Args:
+            subtensor: Connected subtensor instance
+            block: Optional block to query at (defaults to the chain head)
+
+        Raises:
+            RuntimeError: If the subnet does not exist at the queried block
+        """
+        if self._field_indices is not None:
+            info = subtensor.get_metagraph_info(
+                netuid=self.netuid, field_indices=self._field_indices, block=block
+            )
+            if info is not None and any(
+                getattr(info, field) is None
+                for field in ("hotkeys", "last_update", "block", "tempo")
+            ):
+                bt.logging.debug("Selective metagraph query omitted fields; using full queries")
+                self._field_indices = None
+                info = subtensor.get_metagraph_info(netuid=self.netuid, block=block)
+        else:
+            info = subtensor.get_metagraph_info(netuid=self.netuid, block=block)
+        if info is None:
+            raise RuntimeError(f"Subnet netuid={self.netuid} not found on chain")
+        self.hotkeys = list(info.hotkeys)
+        self.last_update = [int(value) for value in info.last_update]
+        self.block = int(info.block)
+        self.tempo = int(info.tempo)
+        self.owner_hotkey = info.owner_hotkey
+
+    def __repr__(self) -> str:
+        return (
+            f"MetagraphSnapshot(netuid:{self.netuid}, n:{self.n}, "
+            f"block:{self.block}, tempo:{self.tempo})"
+        )
+
+
+def index_hotkeys(hotkeys: Iterable[str]) -> dict[str, int]:
+    """Map each hotkey to its UID (its position in ``metagraph.hotkeys``)."""
+    return {hotkey: uid for uid, hotkey in enumerate(hotkeys)}
+
+
+def load_metagraph(subtensor: Any, netuid: int) -> Any:
+    """Return a synced metagraph view for ``netuid``.
+
+    Uses a :class:`MetagraphSnapshot` when the subtensor supports
+    ``get_metagraph_info``, and falls back to the full ``subtensor.metagraph()``
+    otherwise. That call normally returns an already-synced graph, so it is only
+    synced again when its block is still 0.
+
+    Args:
+        subtensor: Connected subtensor instance
+        netuid: Subnet to load
+
+    Returns:
+        Object exposing ``hotkeys``, ``last_update``, ``n``, ``block``, ``tempo``,
+        ``owner_hotkey`` and ``sync(subtensor=...)``
+    """
+    if not hasattr(subtensor, "get_metagraph_info"):
+        bt.logging.debug("Subtensor has no get_metagraph_info; using full metagraph sync")
+        metagraph = subtensor.metagraph(netuid)
+        if not int(getattr(metagraph, "block", 0)):
+            metagraph.sync(subtensor=subtensor)
+        return metagraph
+    metagraph = MetagraphSnapshot(netuid)
+    metagraph.sync(subtensor=subtensor)
+    return metagraph
+
+
+__all__ = ["MetagraphSnapshot", "index_hotkeys", "load_metagraph"]
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import UTC, datetime
-from statistics import mean
 from time import perf_counter
 from typing import Any
 
@@ -12,11 +12,36 @@ import bittensor as bt
 from web3 import Web3
 
 from .config import ValidatorSettings
-from .indexer import replay_owner
+from .indexer import get_rpc_session, replay_owner
 from .logging import ANSI_BOLD, ANSI_RED, ANSI_RESET, ANSI_YELLOW
+from .metagraph import index_hotkeys
 from .scoring import score_entry
 from .weights import _normalize, publish
 
+# How long a head-block read is reused for inference and lag metrics
+HEAD_BLOCK_TTL_SECONDS = 5.0
+
+# Pre-rendered log prefixes for the per-entry error and skip paths
+_ERR_UID = f"{ANSI_BOLD}{ANSI_RED}[UID RESOLUTION ERROR]{ANSI_RESET} "
+_ERR_RPC_INIT = f"{ANSI_BOLD}{ANSI_RED}[RPC INIT ERROR]{ANSI_RESET} "
+_ERR_BLOCK = f"{ANSI_BOLD}{ANSI_RED}[BLOCK INFERENCE ERROR]{ANSI_RESET} "
+_ERR_REPLAY = f"{ANSI_BOLD}{ANSI_RED}[REPLAY ERROR]{ANSI_RESET} "
+_WARN_DEREGISTERED = f"{ANSI_BOLD}{ANSI_YELLOW}[DEREGISTERED HOTKEY]{ANSI_RESET} "
+_INFO_MIN_ASSETS = f"{ANSI_BOLD}{ANSI_YELLOW}[MIN ASSETS]{ANSI_RESET} "
+_TIP_PREFIX = f"{ANSI_BOLD}{ANSI_YELLOW}💡 Tip:{ANSI_RESET} "
+_VERIFIED_AMOUNTS_FLAG = f"{ANSI_BOLD}--use-verified-amounts{ANSI_RESET}"
+_RPC_URL_MISSING = "NOT CONFIGURED"
+
+# Entry field aliases, in lookup order (verifier camelCase first, then snake_case)
+_CHAIN_ID_KEYS = ("chainId", "chain_id")
+_OWNER_KEYS = ("minerEvmAddress", "miner_evm_address", "evm")
+_BLOCK_KEYS = ("block", "atBlock", "at_block")
+
+# Display format for USDC amounts in ranking payloads
+_USDC_FORMAT_SPEC = ",.6f"
+# Largest integer a float holds exactly (53-bit mantissa)
+_MAX_EXACT_FLOAT_INT = 2**53
+
 ReplayFn = Callable[[int, str, str, int, Web3 | None], Mapping[str, Mapping[str, int]]]
 PublishFn = Callable[
     [
@@ -31,50 +56,125 @@ PublishFn = Callable[
     ],
     dict[int, float],
 ]
+# A submitted replay: its positions and wall time in milliseconds
+_ReplayFuture = Future[tuple[Mapping[str, Mapping[str, int]], float]]
+# (chain_id, vault, owner, at_block, block_inferred, provider, future) for one entry
+_ReplayJob = tuple[int, str, str, int, bool, Web3, _ReplayFuture]
+
+
+def _first_present(entry: Mapping[str, Any], keys: tuple[str, ...]) -> Any | None:
+    """Return the first truthy value among ``keys`` in ``entry``, or None."""
+    for key in keys:
+        value = entry.get(key)
+        if value:
+            return value
+    return None
+
+
+def _coerce_block(block: Any) -> int | None:
+    """Convert a raw block field to int, or None if it is missing or malformed."""
+    if block is None:
+        return None
+    try:
+        return int(block)
+    except (ValueError, TypeError):
+        return None
 
 
 def resolve_owner(entry: Mapping[str, Any]) -> str | None:
     """Extract owner EVM address from entry."""
-    return (
-        entry.get("minerEvmAddress")
-        or entry.get("miner_evm_address")
-        or entry.get("evm")
-    )
+    return _first_present(entry, _OWNER_KEYS)
 
 
 def resolve_block(entry: Mapping[str, Any]) -> int | None:
     """Extract block number from entry."""
-    block = entry.get("block") or entry.get("atBlock") or entry.get("at_block")
-    if block is not None:
-        try:
-            return int(block)
-        except (ValueError, TypeError):
-            return None
-    return None
+    return _coerce_block(_first_present(entry, _BLOCK_KEYS))
+
+
+def resolve_entry(
+    entry: Mapping[str, Any],
+) -> tuple[Any | None, str | None, str | None, int | None]:
+    """Extract all replay fields from an entry in a single pass.
+
+    Returns:
+        Tuple of (chain_id, vault, owner, block); missing fields are None
+    """
+    return (
+        _first_present(entry, _CHAIN_ID_KEYS),
+        entry.get("vault"),
+        _first_present(entry, _OWNER_KEYS),
+        _coerce_block(_first_present(entry, _BLOCK_KEYS)),
+    )
+
+
+def _get_head_block(
+    chain_id: int,
+    provider: Web3,
+    cache: dict[int, tuple[int, float]],
+    ttl: float = HEAD_BLOCK_TTL_SECONDS,
+) -> int:
+    """Return the chain's latest block, re-reading it at most once per ``ttl`` seconds."""
+    cached = cache.get(chain_id)
+    now = perf_counter()
+    if cached is not None and now - cached[1] < ttl:
+        return cached[0]
+    block = int(provider.eth.block_number)
+    cache[chain_id] = (block, now)
+    return block
+
+
+def _timed_replay(
+    replay_fn: ReplayFn,
+    chain_id: int,
+    vault: str,
+    owner: str,
+    at_block: int,
+    provider: Web3,
+) -> tuple[Mapping[str, Mapping[str, int]], float]:
+    """Run one replay and return its positions with the replay time in milliseconds."""
+    replay_start = perf_counter()
+    positions = replay_fn(chain_id, vault, owner, at_block, web3=provider)
+    return positions, (perf_counter() - replay_start) * 1000
+
+
+def _average_ms(samples: list[float]) -> float:
+    """Return the arithmetic mean of ``samples``, or 0.0 when there are none."""
+    return sum(samples) / len(samples) if samples else 0.0
+
+
+def _as_int(value: Any) -> int:
+    """Return ``value`` as an int, skipping the conversion when it already is one."""
+    return value if type(value) is int else int(value)
 
 
 def format_positions(
-    positions: Mapping[str, Mapping[str, int]], unit: float
+    positions: Mapping[str, Mapping[str, int]], unit: int
 ) -> dict[str, dict[str, Any]]:
     """Format position data for display.
     
     Supports per-position keys (e.g. "pool_id#0") by reading the actual
-    pool_id from the position data when available.
+    pool_id from the position data when available. ``unit`` is the integer
+    base-unit scale (10**token_decimals); amounts are only converted to
+    floats here, for the human-readable USDC string.
     """
-    formatted: dict[str, dict[str, Any]] = {}
-    for pos_key, data in positions.items():
-        # Use stored pool_id if available (per-position scoring),
-        # otherwise fall back to the dict key (legacy combined format)
-        actual_pool_id = data.get("pool_id", pos_key)
-        amount_raw = int(data.get("amount", 0))
-        amount_usdc = amount_raw / unit
-        formatted[pos_key] = {
-            "pool_id": actual_pool_id,
-            "amountRaw": amount_raw,
-            "amountUSDC": f"{amount_usdc:,.6f} USDC",
-            "lockDays": int(data.get("lockDays", 0)),
+    # Multiply by the reciprocal while the amount is exactly representable as a
+    # float; larger amounts keep int/int true division, which rounds correctly
+    unit_inv = 1.0 / unit
+    # Use stored pool_id if available (per-position scoring),
+    # otherwise fall back to the dict key (legacy combined format)
+    return {
+        pos_key: {
+            "pool_id": data.get("pool_id", pos_key),
+            "amountRaw": (amount_raw := _as_int(data.get("amount", 0))),
+            "amountUSDC": format(
+                amount_raw * unit_inv if amount_raw <= _MAX_EXACT_FLOAT_INT else amount_raw / unit,
+                _USDC_FORMAT_SPEC,
+            )
+            + " USDC",
+            "lockDays": _as_int(data.get("lockDays", 0)),
         }
-    return formatted
+        for pos_key, data in positions.items()
+    }
 
 
 def process_entries(
@@ -92,8 +192,13 @@ def process_entries(
     use_verified_amounts: bool = False,
     force: bool = False,
     deregistered_hotkeys: set[str] | None = None,
+    hotkey_to_uid: Mapping[str, int] | None = None,
 ) -> dict[str, Any]:
-    """Replay events, score miners, and optionally publish weights."""
+    """Replay events, score miners, and optionally publish weights.
+
+    ``hotkey_to_uid`` is the caller's hotkey→UID index for the synced metagraph;
+    when omitted it is built from ``metagraph.hotkeys``.
+    """
     start_time = perf_counter()
     scores: dict[int, float] = {}
     details: list[dict[str, Any]] = []
@@ -109,45 +214,62 @@ def process_entries(
         "rpc_lag_blocks": [],
         "expired_pools": 0,
     }
-    unit = float(10**settings.token_decimals)
+    # Integer base-unit scale; amounts stay raw ints until formatted for display
+    unit = 10**settings.token_decimals
+    # One reference time for every expiry/deregistration check in this pass
+    current_time = datetime.now(UTC)
     web3_cache: dict[int, Web3] = {}
+    # RPC URL per chain as shown in error logs, resolved once per pass
+    rpc_url_labels = {chain: url or _RPC_URL_MISSING for chain, url in settings.rpc_urls.items()}
+    # Latest block per chain, shared by block inference and lag (see _get_head_block)
+    head_block_cache: dict[int, tuple[int, float]] = {}
     subtensor = subtensor or bt.subtensor()
 
     grouped: dict[int, dict[str, Any]] = {}
     sources: dict[int, list[Mapping[str, Any]]] = {}
+    # Resolve UIDs from the synced metagraph; only unknown hotkeys cost a chain query
+    if hotkey_to_uid is None:
+        hotkey_to_uid = (
+            index_hotkeys(metagraph.hotkeys)
+            if metagraph is not None and hasattr(metagraph, "hotkeys")
+            else {}
+        )
+
+    # Bound once; the grouping loop below runs for every verifier row
+    lookup_uid = hotkey_to_uid.get
+    query_uid = subtensor.get_uid_for_hotkey_on_subnet
+    netuid = settings.netuid
+    log_warning = bt.logging.warning
 
     for entry in entries:
         metrics["total_rows"] += 1
         hotkey = entry.get("hotkey")
         if not hotkey:
-            bt.logging.warning("Skipping entry missing hotkey: %s", entry)
+            log_warning("Skipping entry missing hotkey: %s", entry)
             metrics["skipped"] += 1
             continue
 
         try:
-            uid = subtensor.get_uid_for_hotkey_on_subnet(
-                hotkey_ss58=hotkey, netuid=settings.netuid
-            )
+            uid = lookup_uid(hotkey)
+            if uid is None:
+                uid = query_uid(hotkey_ss58=hotkey, netuid=netuid)
         except Exception as exc:  # pragma: no cover
-            import traceback
-
             bt.logging.error(
-                f"{ANSI_BOLD}{ANSI_RED}[UID RESOLUTION ERROR]{ANSI_RESET} "
-                f"Failed to resolve UID for hotkey"
+                f"{_ERR_UID}Failed to resolve UID for hotkey\n"
+                f"Error type: {type(exc).__name__}\n"
+                f"Error message: {exc}\n"
+                f"Hotkey: {hotkey}\n"
+                f"Netuid: {netuid}"
             )
-            bt.logging.error(f"Error type: {type(exc).__name__}")
-            bt.logging.error(f"Error message: {str(exc)}")
-            bt.logging.error(f"Hotkey: {hotkey}")
-            bt.logging.error(f"Netuid: {settings.netuid}")
-            bt.logging.debug(f"Traceback:\n{traceback.format_exc()}")
+            bt.logging.debug("Traceback:", exc_info=True)
             metrics["failures"] += 1
             continue
 
         if uid is None or uid < 0:
-            bt.logging.warning(
+            log_warning(
                 "Hotkey %s not registered on netuid %s; skipping.",
                 hotkey,
-                settings.netuid,
+                netuid,
             )
             metrics["missing_uid"] += 1
             metrics["skipped"] += 1
@@ -169,252 +291,270 @@ def process_entries(
     if deregistered_hotkeys is None:
         deregistered_hotkeys = set()
     
-    for uid, miner_entries in sources.items():
-        combined_positions: dict[str, dict[str, int]] = {}
-        per_miner_replay: list[float] = []
-        miner_failed = False
+    # Pass 1: filter entries and resolve replay inputs; on-chain replays are network
+    # bound and independent, so they are submitted to a pool and overlap each other
+    pending: dict[
+        int, tuple[dict[str, dict[str, int]], int, list[float], bool, list[_ReplayJob]]
+    ] = {}
+    # Identical (chain, vault, owner, block) replays share one call
+    replay_memo: dict[tuple[int, str, str, int], _ReplayFuture] = {}
+    with ThreadPoolExecutor(
+        max_workers=max(1, settings.replay_concurrency), thread_name_prefix="replay"
+    ) as replay_pool:
+        for uid, miner_entries in sources.items():
+            combined_positions: dict[str, dict[str, int]] = {}
+            # Running sum of position amounts, kept alongside combined_positions
+            total_amount = 0
+            per_miner_replay: list[float] = []
+            miner_failed = False
+            replay_jobs: list[_ReplayJob] = []
         
-        # Check if this hotkey is deregistered - if so, score all positions as 0
-        hotkey = grouped.get(uid, {}).get("hotkey")
-        if hotkey and hotkey in deregistered_hotkeys:
-            bt.logging.warning(
-                f"{ANSI_BOLD}{ANSI_YELLOW}[DEREGISTERED HOTKEY]{ANSI_RESET} "
-                f"Hotkey {hotkey} (UID {uid}) is deregistered - scoring all positions as 0"
-            )
-            # Set score to 0 for this UID (all positions)
-            scores[uid] = 0.0
-            metrics["skipped"] += len(miner_entries)
-            metrics["expired_pools"] = metrics.get("expired_pools", 0) + len(miner_entries)
-            continue  # Skip processing this miner entirely
-
-        for entry in miner_entries:
-            if use_verified_amounts:
-                # Use pool_id from verifier (now included in VerifiedMinerEntry)
-                pool_id = entry.get("pool_id", "default")
-
-                # Check if this pool has expired, been released, or miner was deregistered
-                current_time = datetime.now(UTC)
-                
-                # Check if miner was deregistered mid-epoch
-                deregistered_at_str = entry.get("deregistered_at")
-                if deregistered_at_str:
-                    try:
-                        # Parse deregistered_at - handle both ISO format strings and datetime objects
-                        if isinstance(deregistered_at_str, str):
-                            # Handle ISO format with or without timezone
-                            if deregistered_at_str.endswith("Z"):
-                                deregistered_at = datetime.fromisoformat(
-                                    deregistered_at_str.replace("Z", "+00:00")
-                                )
+            # Check if this hotkey is deregistered - if so, score all positions as 0
+            hotkey = grouped.get(uid, {}).get("hotkey")
+            if hotkey and hotkey in deregistered_hotkeys:
+                bt.logging.warning(
+                    f"{_WARN_DEREGISTERED}Hotkey {hotkey} (UID {uid}) is deregistered "
+                    "- scoring all positions as 0"
+                )
+                # Set score to 0 for this UID (all positions)
+                scores[uid] = 0.0
+                metrics["skipped"] += len(miner_entries)
+                metrics["expired_pools"] = metrics.get("expired_pools", 0) + len(miner_entries)
+                continue  # Skip processing this miner entirely
+
+            for entry in miner_entries:
+                if use_verified_amounts:
+                    # Use pool_id from verifier (now included in VerifiedMinerEntry)
+                    pool_id = entry.get("pool_id", "default")
+
+                    # Check if this pool has expired, been released, or miner was deregistered
+                    # Check if miner was deregistered mid-epoch
+                    deregistered_at_str = entry.get("deregistered_at")
+                    if deregistered_at_str:
+                        try:
+                            # Parse deregistered_at - handle both ISO format strings and datetime objects
+                            if isinstance(deregistered_at_str, str):
+                                # Handle ISO format with or without timezone
+                                if deregistered_at_str.endswith("Z"):
+                                    deregistered_at = datetime.fromisoformat(
+                                        deregistered_at_str.replace("Z", "+00:00")
+                                    )
+                                else:
+                                    deregistered_at = datetime.fromisoformat(deregistered_at_str)
+                                # Ensure timezone-aware
+                                if deregistered_at.tzinfo is None:
+                                    deregistered_at = deregistered_at.replace(tzinfo=UTC)
                             else:
-                                deregistered_at = datetime.fromisoformat(deregistered_at_str)
-                            # Ensure timezone-aware
-                            if deregistered_at.tzinfo is None:
-                                deregistered_at = deregistered_at.replace(tzinfo=UTC)
-                        else:
-                            deregistered_at = deregistered_at_str
-                            if deregistered_at.tzinfo is None:
-                                deregistered_at = deregistered_at.replace(tzinfo=UTC)
-
-                        if deregistered_at <= current_time:
-                            # Miner was deregistered mid-epoch - skip this pool (don't add to combined_positions)
-                            hotkey = grouped.get(uid, {}).get("hotkey", "unknown")
-                            bt.logging.debug(
-                                f"Miner deregistered for uid={uid} hotkey={hotkey}: "
-                                f"deregistered_at={deregistered_at} <= current_time={current_time}"
-                            )
-                            metrics["expired_pools"] = (
-                                metrics.get("expired_pools", 0) + 1
+                                deregistered_at = deregistered_at_str
+                                if deregistered_at.tzinfo is None:
+                                    deregistered_at = deregistered_at.replace(tzinfo=UTC)
+
+                            if deregistered_at <= current_time:
+                                # Miner was deregistered mid-epoch - skip this pool (don't add to combined_positions)
+                                hotkey = grouped.get(uid, {}).get("hotkey", "unknown")
+                                bt.logging.debug(
+                                    f"Miner deregistered for uid={uid} hotkey={hotkey}: "
+                                    f"deregistered_at={deregistered_at} <= current_time={current_time}"
+                                )
+                                metrics["expired_pools"] = (
+                                    metrics.get("expired_pools", 0) + 1
+                                )
+                                continue
+                        except (ValueError, TypeError) as exc:
+                            bt.logging.warning(
+                                f"Failed to parse deregistered_at for uid={uid} pool={pool_id}: {deregistered_at_str}, error: {exc}"
                             )
-                            continue
-                    except (ValueError, TypeError) as exc:
-                        bt.logging.warning(
-                            f"Failed to parse deregistered_at for uid={uid} pool={pool_id}: {deregistered_at_str}, error: {exc}"
-                        )
-                        # Continue processing if we can't parse deregistered_at (don't skip the pool)
+                            # Continue processing if we can't parse deregistered_at (don't skip the pool)
                 
-                # Check if pool has expired
-                expires_at_str = entry.get("expires_at")
-                if expires_at_str:
-                    try:
-                        # Parse expires_at - handle both ISO format strings and datetime objects
-                        if isinstance(expires_at_str, str):
-                            # Handle ISO format with or without timezone
-                            if expires_at_str.endswith("Z"):
-                                expires_at = datetime.fromisoformat(
-                                    expires_at_str.replace("Z", "+00:00")
-                                )
+                    # Check if pool has expired
+                    expires_at_str = entry.get("expires_at")
+                    if expires_at_str:
+                        try:
+                            # Parse expires_at - handle both ISO format strings and datetime objects
+                            if isinstance(expires_at_str, str):
+                                # Handle ISO format with or without timezone
+                                if expires_at_str.endswith("Z"):
+                                    expires_at = datetime.fromisoformat(
+                                        expires_at_str.replace("Z", "+00:00")
+                                    )
+                                else:
+                                    expires_at = datetime.fromisoformat(expires_at_str)
+                                # Ensure timezone-aware
+                                if expires_at.tzinfo is None:
+                                    expires_at = expires_at.replace(tzinfo=UTC)
                             else:
-                                expires_at = datetime.fromisoformat(expires_at_str)
-                            # Ensure timezone-aware
-                            if expires_at.tzinfo is None:
-                                expires_at = expires_at.replace(tzinfo=UTC)
-                        else:
-                            expires_at = expires_at_str
-                            if expires_at.tzinfo is None:
-                                expires_at = expires_at.replace(tzinfo=UTC)
-
-                        if expires_at < current_time:
-                            # Pool has expired - skip this pool (don't add to combined_positions)
-                            hotkey = grouped.get(uid, {}).get("hotkey", "unknown")
-                            bt.logging.debug(
-                                f"Pool {pool_id} expired for uid={uid} hotkey={hotkey}: "
-                                f"expires_at={expires_at} < current_time={current_time}"
-                            )
-                            metrics["expired_pools"] = (
-                                metrics.get("expired_pools", 0) + 1
+                                expires_at = expires_at_str
+                                if expires_at.tzinfo is None:
+                                    expires_at = expires_at.replace(tzinfo=UTC)
+
+                            if expires_at < current_time:
+                                # Pool has expired - skip this pool (don't add to combined_positions)
+                                hotkey = grouped.get(uid, {}).get("hotkey", "unknown")
+                                bt.logging.debug(
+                                    f"Pool {pool_id} expired for uid={uid} hotkey={hotkey}: "
+                                    f"expires_at={expires_at} < current_time={current_time}"
+                                )
+                                metrics["expired_pools"] = (
+                                    metrics.get("expired_pools", 0) + 1
+                                )
+                                continue
+                        except (ValueError, TypeError) as exc:
+                            bt.logging.warning(
+                                f"Failed to parse expires_at for uid={uid} pool={pool_id}: {expires_at_str}, error: {exc}"
                             )
-                            continue
-                    except (ValueError, TypeError) as exc:
-                        bt.logging.warning(
-                            f"Failed to parse expires_at for uid={uid} pool={pool_id}: {expires_at_str}, error: {exc}"
-                        )
-                        # Continue processing if we can't parse expires_at (don't skip the pool)
-
-                amount = int(entry.get("amount", 0))
-                lock_days = int(entry.get("lock_days", 0))
-                # Score each position individually (don't combine by pool_id)
-                # Each position keeps its own lock_days for accurate boost calculation
-                pos_key = f"{pool_id}#{len(combined_positions)}"
-                combined_positions[pos_key] = {
-                    "amount": amount,
-                    "lockDays": lock_days,
-                    "pool_id": pool_id,
-                }
-                continue
-
-            # Note: chain_id, vault, and owner are no longer exposed in API
-            # Validators must use --use-verified-amounts or have their own data source
-            chain_id = entry.get("chainId") or entry.get("chain_id")
-            vault = entry.get("vault")
-            owner = resolve_owner(entry)
-            if None in (chain_id, vault, owner):
-                bt.logging.warning(
-                    "Entry for uid=%s missing replay fields (chain=%s vault=%s owner=%s); skipping entry.",
-                    uid,
-                    chain_id,
-                    vault,
-                    owner,
-                )
-                metrics["skipped"] += 1
-                miner_failed = True
-                continue
-
-            chain_id = int(chain_id)
-            try:
-                provider = web3_cache.get(chain_id)
-                if provider is None:
-                    rpc_url = settings.rpc_urls.get(chain_id)
-                    if not rpc_url:
-                        raise ValueError(f"No RPC configured for chain_id={chain_id}")
-                    provider = Web3(Web3.HTTPProvider(rpc_url))
-                    web3_cache[chain_id] = provider
-            except Exception as exc:
-                import traceback
+                            # Continue processing if we can't parse expires_at (don't skip the pool)
+
+                    amount = int(entry.get("amount", 0))
+                    lock_days = int(entry.get("lock_days", 0))
+                    # Score each position individually (don't combine by pool_id)
+                    # Each position keeps its own lock_days for accurate boost calculation
+                    pos_key = f"{pool_id}#{len(combined_positions)}"
+                    combined_positions[pos_key] = {
+                        "amount": amount,
+                        "lockDays": lock_days,
+                        "pool_id": pool_id,
+                    }
+                    total_amount += amount
+                    continue
 
-                bt.logging.error(
-                    f"{ANSI_BOLD}{ANSI_RED}[RPC INIT ERROR]{ANSI_RESET} "
-                    f"Failed to initialise Web3 provider for chain {chain_id}"
-                )
-                bt.logging.error(f"Error type: {type(exc).__name__}")
-                bt.logging.error(f"Error message: {str(exc)}")
-                bt.logging.error(f"UID: {uid}, Chain: {chain_id}, Vault: {vault}")
-                bt.logging.error(
-                    f"RPC URL: {settings.rpc_urls.get(chain_id, 'NOT CONFIGURED')}"
-                )
-                bt.logging.debug(f"Traceback:\n{traceback.format_exc()}")
-                # If RPC is not available and we're not using verified amounts, suggest using the flag
-                if not use_verified_amounts and "Connection refused" in str(exc):
+                # Note: chain_id, vault, and owner are no longer exposed in API
+                # Validators must use --use-verified-amounts or have their own data source
+                chain_id, vault, owner, at_block = resolve_entry(entry)
+                if chain_id is None or vault is None or owner is None:
                     bt.logging.warning(
-                        f"{ANSI_BOLD}{ANSI_YELLOW}💡 Tip:{ANSI_RESET} "
-                        f"RPC endpoint not available for chain {chain_id}. "
-                        f"Use {ANSI_BOLD}--use-verified-amounts{ANSI_RESET} to bypass RPC replay "
-                        f"and use verifier-supplied amounts instead."
-                    )
-                metrics["failures"] += 1
-                miner_failed = True
-                continue
-
-            at_block = resolve_block(entry)
-            if at_block is None:
-                try:
-                    at_block = int(provider.eth.block_number)
-                    metrics["inferred_blocks"] += 1
-                    bt.logging.debug(
-                        "No snapshot block for uid=%s chain=%s; defaulting to latest block %s.",
+                        "Entry for uid=%s missing replay fields (chain=%s vault=%s owner=%s); skipping entry.",
                         uid,
                         chain_id,
-                        at_block,
+                        vault,
+                        owner,
                     )
-                except Exception as exc:  # pragma: no cover
-                    import traceback
+                    metrics["skipped"] += 1
+                    miner_failed = True
+                    continue
 
+                chain_id = int(chain_id)
+                try:
+                    provider = web3_cache.get(chain_id)
+                    if provider is None:
+                        rpc_url = settings.rpc_urls.get(chain_id)
+                        if not rpc_url:
+                            raise ValueError(f"No RPC configured for chain_id={chain_id}")
+                        provider = Web3(
+                            Web3.HTTPProvider(rpc_url, session=get_rpc_session())
+                        )
+                        web3_cache[chain_id] = provider
+                except Exception as exc:
                     bt.logging.error(
-                        f"{ANSI_BOLD}{ANSI_RED}[BLOCK INFERENCE ERROR]{ANSI_RESET} "
-                        f"Unable to infer block for uid={uid}"
-                    )
-                    bt.logging.error(f"Error type: {type(exc).__name__}")
-                    bt.logging.error(f"Error message: {str(exc)}")
-                    bt.logging.error(f"Chain: {chain_id}, Vault: {vault}")
-                    bt.logging.error(
-                        f"RPC URL: {settings.rpc_urls.get(chain_id, 'NOT CONFIGURED')}"
+                        f"{_ERR_RPC_INIT}Failed to initialise Web3 provider for chain {chain_id}\n"
+                        f"Error type: {type(exc).__name__}\n"
+                        f"Error message: {exc}\n"
+                        f"UID: {uid}, Chain: {chain_id}, Vault: {vault}\n"
+                        f"RPC URL: {rpc_url_labels.get(chain_id, _RPC_URL_MISSING)}"
                     )
-                    bt.logging.debug(f"Traceback:\n{traceback.format_exc()}")
+                    bt.logging.debug("Traceback:", exc_info=True)
+                    # If RPC is not available and we're not using verified amounts, suggest using the flag
+                    if not use_verified_amounts and "Connection refused" in str(exc):
+                        bt.logging.warning(
+                            f"{_TIP_PREFIX}RPC endpoint not available for chain {chain_id}. "
+                            f"Use {_VERIFIED_AMOUNTS_FLAG} to bypass RPC replay "
+                            f"and use verifier-supplied amounts instead."
+                        )
                     metrics["failures"] += 1
                     miner_failed = True
                     continue
 
-            replay_start = perf_counter()
-            try:
-                positions = replay_fn(
-                    chain_id, vault, owner, int(at_block), web3=provider
+                block_inferred = at_block is None
+                if at_block is None:
+                    try:
+                        at_block = _get_head_block(chain_id, provider, head_block_cache)
+                        metrics["inferred_blocks"] += 1
+                        bt.logging.debug(
+                            "No snapshot block for uid=%s chain=%s; defaulting to latest block %s.",
+                            uid,
+                            chain_id,
+                            at_block,
+                        )
+                    except Exception as exc:  # pragma: no cover
+                        bt.logging.error(
+                            f"{_ERR_BLOCK}Unable to infer block for uid={uid}\n"
+                            f"Error type: {type(exc).__name__}\n"
+                            f"Error message: {exc}\n"
+                            f"Chain: {chain_id}, Vault: {vault}\n"
+                            f"RPC URL: {rpc_url_labels.get(chain_id, _RPC_URL_MISSING)}"
+                        )
+                        bt.logging.debug("Traceback:", exc_info=True)
+                        metrics["failures"] += 1
+                        miner_failed = True
+                        continue
+
+                replay_key = (chain_id, vault.lower(), owner.lower(), int(at_block))
+                future = replay_memo.get(replay_key)
+                if future is None:
+                    future = replay_memo[replay_key] = replay_pool.submit(
+                        _timed_replay, replay_fn, chain_id, vault, owner, int(at_block), provider
+                    )
+                replay_jobs.append(
+                    (chain_id, vault, owner, at_block, block_inferred, provider, future)
                 )
-            except Exception as exc:  # pragma: no cover
-                import traceback
 
+            pending[uid] = (
+                combined_positions, total_amount, per_miner_replay, miner_failed, replay_jobs
+            )
+
+    # Pass 2: collect replay results in entry order and score each miner
+    timed_replays: set[_ReplayFuture] = set()
+    for uid, (
+        combined_positions, total_amount, per_miner_replay, miner_failed, replay_jobs
+    ) in pending.items():
+        miner_entries = sources[uid]
+        for chain_id, vault, owner, at_block, block_inferred, provider, future in replay_jobs:
+            try:
+                positions, duration_ms = future.result()
+            except Exception as exc:  # pragma: no cover
                 bt.logging.error(
-                    f"{ANSI_BOLD}{ANSI_RED}[REPLAY ERROR]{ANSI_RESET} "
-                    f"Replay failed for uid={uid}"
-                )
-                bt.logging.error(f"Error type: {type(exc).__name__}")
-                bt.logging.error(f"Error message: {str(exc)}")
-                bt.logging.error(
-                    f"Chain: {chain_id}, Vault: {vault}, Owner: {owner}, Block: {at_block}"
-                )
-                bt.logging.error(
-                    f"RPC URL: {settings.rpc_urls.get(chain_id, 'NOT CONFIGURED')}"
+                    f"{_ERR_REPLAY}Replay failed for uid={uid}\n"
+                    f"Error type: {type(exc).__name__}\n"
+                    f"Error message: {exc}\n"
+                    f"Chain: {chain_id}, Vault: {vault}, Owner: {owner}, Block: {at_block}\n"
+                    f"RPC URL: {rpc_url_labels.get(chain_id, _RPC_URL_MISSING)}"
                 )
-                bt.logging.debug(f"Traceback:\n{traceback.format_exc()}")
+                bt.logging.debug("Traceback:", exc_info=True)
                 # If RPC connection failed and we're not using verified amounts, suggest using the flag
                 if not use_verified_amounts and "Connection refused" in str(exc):
                     bt.logging.warning(
-                        f"{ANSI_BOLD}{ANSI_YELLOW}💡 Tip:{ANSI_RESET} "
-                        f"RPC endpoint not available. "
-                        f"Use {ANSI_BOLD}--use-verified-amounts{ANSI_RESET} to bypass RPC replay."
+                        f"{_TIP_PREFIX}RPC endpoint not available. "
+                        f"Use {_VERIFIED_AMOUNTS_FLAG} to bypass RPC replay."
                     )
                 metrics["failures"] += 1
                 miner_failed = True
                 continue
-            duration_ms = (perf_counter() - replay_start) * 1000
-            metrics["replay_ms"].append(duration_ms)
-            per_miner_replay.append(duration_ms)
-
-            try:
-                current_block = provider.eth.block_number
-                metrics["rpc_lag_blocks"].append(
-                    max(0, int(current_block) - int(at_block))
-                )
-            except Exception:  # pragma: no cover
-                bt.logging.debug("Failed to compute RPC lag for chain %s", chain_id)
+            if future not in timed_replays:  # count a shared replay's time once
+                timed_replays.add(future)
+                metrics["replay_ms"].append(duration_ms)
+                per_miner_replay.append(duration_ms)
+
+            if block_inferred:
+                # Replayed at the head block itself, so there is no lag to measure
+                metrics["rpc_lag_blocks"].append(0)
+            else:
+                try:
+                    current_block = _get_head_block(chain_id, provider, head_block_cache)
+                    metrics["rpc_lag_blocks"].append(
+                        max(0, int(current_block) - int(at_block))
+                    )
+                except Exception:  # pragma: no cover
+                    bt.logging.debug("Failed to compute RPC lag for chain %s", chain_id)
 
             for pool_id, data in positions.items():
                 # Score each position individually (don't combine by pool_id)
                 pos_key = f"{pool_id}#{len(combined_positions)}"
+                amount = int(data.get("amount", 0))
                 combined_positions[pos_key] = {
-                    "amount": int(data.get("amount", 0)),
+                    "amount": amount,
                     "lockDays": int(data.get("lockDays", 0)),
                     "pool_id": pool_id,
                 }
+                total_amount += amount
 
         if not combined_positions:
             if miner_failed:
@@ -430,7 +570,6 @@ def process_entries(
         # Log scoring details for this miner
         hotkey = grouped.get(uid, {}).get("hotkey", "unknown")
         pool_count = len(combined_positions)
-        total_amount = sum(pos.get("amount", 0) for pos in combined_positions.values())
         total_amount_usdc = total_amount / unit
         bt.logging.debug(
             f"[SCORING] uid={uid} hotkey={hotkey}: Scoring {pool_count} pool(s), "
@@ -451,8 +590,8 @@ def process_entries(
         min_threshold = settings.min_total_assets_usdc
         if total_amount_usdc < min_threshold:
             bt.logging.info(
-                f"{ANSI_BOLD}{ANSI_YELLOW}[MIN ASSETS]{ANSI_RESET} "
-                f"uid={uid} hotkey={hotkey}: Total assets {total_amount_usdc:,.2f} USDC "
+                f"{_INFO_MIN_ASSETS}uid={uid} hotkey={hotkey}: "
+                f"Total assets {total_amount_usdc:,.2f} USDC "
                 f"< minimum threshold {min_threshold:,.2f} USDC → score=0"
             )
             score = 0.0
@@ -476,7 +615,7 @@ def process_entries(
                 "score": score,
                 "positions": combined_positions,
                 "sources": miner_entries,
-                "avgReplayMs": mean(per_miner_replay) if per_miner_replay else 0.0,
+                "avgReplayMs": _average_ms(per_miner_replay),
             }
         )
 
@@ -539,7 +678,7 @@ def process_entries(
     summary = {
         **metrics,
         "elapsed_ms": (perf_counter() - start_time) * 1000,
-        "avg_replay_ms": mean(metrics["replay_ms"]) if metrics["replay_ms"] else 0.0,
+        "avg_replay_ms": _average_ms(metrics["replay_ms"]),
         "max_rpc_lag": (
             max(metrics["rpc_lag_blocks"]) if metrics["rpc_lag_blocks"] else 0
         ),
@@ -0,0 +1,262 @@
+"""Tests for daemon loop scheduling helpers."""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import bittensor as bt
+import pytest
+from websockets.exceptions import ConnectionClosed
+
+from cartha_validator import main as validator_main
+from cartha_validator.logging import is_enabled_for
+from cartha_validator.main import (
+    BLOCK_TIME_SECONDS,
+    EPOCH_ROLLOVER_GRACE_SECONDS,
+    ERROR_BACKOFF_BASE_SECONDS,
+    ERROR_BACKOFF_JITTER_FRACTION,
+    MIN_IDLE_WAIT_SECONDS,
+    MIN_METAGRAPH_SYNC_INTERVAL_BLOCKS,
+    _error_backoff_seconds,
+    _estimate_block,
+    _idle_wait_seconds,
+    _is_programmer_error,
+    _load_weekly_cache,
+    _metagraph_sync_interval,
+    _require_validator_uid,
+    _resolve_validator_uid,
+    _save_weekly_cache,
+    _select_block_reader,
+    _validator_last_update,
+    _weekly_cache_path,
+)
+
+
+def test_idle_wait_uses_poll_interval_far_from_rollover():
+    assert _idle_wait_seconds(300, seconds_until_rollover=86_400) == 300
+
+
+def test_idle_wait_wakes_just_after_weekly_rollover():
+    wait = _idle_wait_seconds(300, seconds_until_rollover=42)
+    assert wait == pytest.approx(42 + EPOCH_ROLLOVER_GRACE_SECONDS)
+
+
+def test_idle_wait_stretches_while_no_tempo_can_be_due():
+    assert _idle_wait_seconds(300, 86_400, seconds_until_chain_check=4_000) == 2_000
+    assert _idle_wait_seconds(300, 86_400, seconds_until_chain_check=400) == 300
+    assert _idle_wait_seconds(300, 86_400, seconds_until_chain_check=30) == 30
+    assert _idle_wait_seconds(300, 60, seconds_until_chain_check=4_000) == pytest.approx(
+        60 + EPOCH_ROLLOVER_GRACE_SECONDS
+    )
+
+
+def test_idle_wait_deducts_time_spent_working():
+    assert _idle_wait_seconds(300, 86_400, work_seconds=120) == 180
+    assert _idle_wait_seconds(300, 86_400, work_seconds=400) == MIN_IDLE_WAIT_SECONDS
+
+
+def test_idle_wait_never_busy_loops():
+    assert _idle_wait_seconds(300, seconds_until_rollover=-60) == MIN_IDLE_WAIT_SECONDS
+
+
+def test_error_backoff_doubles_up_to_poll_interval():
+    delays = [_error_backoff_seconds(300, failures) for failures in range(1, 10)]
+    assert delays[0] == ERROR_BACKOFF_BASE_SECONDS
+    assert delays[1] == 2 * ERROR_BACKOFF_BASE_SECONDS
+    assert delays == sorted(delays)
+    assert delays[-1] == 300
+    assert _error_backoff_seconds(300, 1, jitter=0.5) == pytest.approx(
+        ERROR_BACKOFF_BASE_SECONDS * (1 + 0.5 * ERROR_BACKOFF_JITTER_FRACTION)
+    )
+
+
+def test_is_enabled_for_follows_bittensor_level(monkeypatch):
+    monkeypatch.setattr(bt.logging, "get_level", lambda: logging.INFO)
+    assert is_enabled_for(logging.INFO)
+    assert not is_enabled_for(logging.DEBUG)
+
+
+def test_wait_returns_immediately_once_stop_requested(monkeypatch):
+    stop_event = validator_main.threading.Event()
+    monkeypatch.setattr(validator_main, "_stop_event", stop_event)
+
+    assert validator_main._wait(0) is False
+    validator_main._request_stop(validator_main.signal.SIGTERM, None)
+    assert validator_main._wait(3600) is True
+
+
+def test_log_warning_skips_build_when_level_disabled(monkeypatch):
+    warning = MagicMock()
+    monkeypatch.setattr(bt.logging, "warning", warning)
+    monkeypatch.setattr(bt.logging, "get_level", lambda: logging.ERROR)
+    validator_main._log_warning("No cached weights available")
+    warning.assert_not_called()
+
+    monkeypatch.setattr(bt.logging, "get_level", lambda: logging.INFO)
+    validator_main._log_warning("No cached weights available", " for weekly epoch x.")
+    (message,), _ = warning.call_args
+    assert message.startswith(validator_main._WARNING_PREFIX)
+    assert message.endswith(" for weekly epoch x.")
+
+
+def test_second_sigint_forces_keyboard_interrupt(monkeypatch):
+    monkeypatch.setattr(validator_main, "_stop_event", validator_main.threading.Event())
+
+    validator_main._request_stop(validator_main.signal.SIGINT, None)
+    assert validator_main._wait(3600) is True
+    with pytest.raises(KeyboardInterrupt):
+        validator_main._request_stop(validator_main.signal.SIGINT, None)
+
+
+def test_finished_background_epoch_wakes_idle_wait(monkeypatch):
+    monkeypatch.setattr(validator_main, "_stop_event", validator_main.threading.Event())
+    monkeypatch.setattr(validator_main, "_wake_event", validator_main.threading.Event())
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(lambda: {"weights": {}})
+        future.add_done_callback(validator_main._wake)
+        assert validator_main._wait(3600) is False
+    assert future.done()
+
+
+def test_block_reader_handles_scalar_and_array_blocks():
+    class ZeroDim:
+        def __iter__(self):
+            raise TypeError("iteration over a 0-d array")
+
+        def __int__(self):
+            return 1234
+
+    array_metagraph = SimpleNamespace(block=ZeroDim())
+    assert _select_block_reader(array_metagraph.block)(array_metagraph) == 1234
+    int_metagraph = SimpleNamespace(block=99)
+    assert _select_block_reader(int_metagraph.block)(int_metagraph) == 99
+
+
+def test_resolve_validator_uid_follows_reordered_hotkeys():
+    assert _resolve_validator_uid({"hk-a": 0, "hk-v": 1}, "hk-v", 0) == 1
+
+
+def test_resolve_validator_uid_drops_uid_of_deregistered_hotkey():
+    # uid 3 was the validator's; after deregistration another neuron holds it
+    metagraph = SimpleNamespace(last_update=[10, 20, 30, 40])
+    validator_uid = _resolve_validator_uid({"hk-a": 0, "hk-new": 3}, "hk-v", 3)
+    assert validator_uid is None
+    assert _validator_last_update(metagraph, validator_uid) == 0
+
+
+def test_estimate_block_advances_at_target_block_time():
+    assert _estimate_block(1_000, 50.0, 50.0) == 1_000
+    assert _estimate_block(1_000, 50.0, 50.0 + 10 * BLOCK_TIME_SECONDS + 1) == 1_010
+    assert _estimate_block(1_000, 50.0, 40.0) == 1_000
+
+
+def test_validator_last_update_reads_synced_block():
+    metagraph = SimpleNamespace(last_update=[100, 250])
+    assert _validator_last_update(metagraph, 1) == 250
+    assert _validator_last_update(metagraph, 5) == 0
+    assert _validator_last_update(metagraph, None) == 0
+    assert _validator_last_update(SimpleNamespace(), 0) == 0
+
+
+def test_ensure_subtensor_reconnects_only_when_ping_fails(monkeypatch):
+    healthy = SimpleNamespace(get_current_block=lambda: 100)
+    assert validator_main._ensure_subtensor(healthy, "finney") == (healthy, False)
+
+    closed = []
+
+    def dead_ping():
+        raise ConnectionError("websocket closed")
+
+    dead = SimpleNamespace(get_current_block=dead_ping, close=lambda: closed.append(True))
+    fresh = SimpleNamespace(get_current_block=lambda: 101)
+    monkeypatch.setattr(validator_main, "_connect_subtensor", lambda network: fresh)
+
+    assert validator_main._ensure_subtensor(dead, "finney") == (fresh, True)
+    assert closed == [True]
+
+
+def test_metagraph_sync_interval_follows_tempo_unless_configured():
+    assert _metagraph_sync_interval(360, None) == 180
+    assert _metagraph_sync_interval(10, None) == MIN_METAGRAPH_SYNC_INTERVAL_BLOCKS
+    assert _metagraph_sync_interval(360, 100) == 100
+
+
+def test_require_validator_uid_rejects_unregistered_hotkey():
+    assert _require_validator_uid({"hk-a": 0, "hk-v": 4}, "hk-v", 35) == 4
+    with pytest.raises(RuntimeError, match="not registered"):
+        _require_validator_uid({"hk-a": 0}, "hk-v", 35)
+
+
+def test_retry_transient_retries_only_connection_errors(monkeypatch):
+    monkeypatch.setattr(validator_main.time, "sleep", lambda seconds: None)
+    outcomes = [ConnectionError("reset"), TimeoutError("slow"), 1234]
+
+    def flaky_read():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert validator_main._retry_transient(flaky_read) == 1234
+
+    def broken_read():
+        outcomes.append("called")
+        raise ValueError("bad response")
+
+    with pytest.raises(ValueError):
+        validator_main._retry_transient(broken_read)
+    assert outcomes == ["called"]
+
+
+def test_retry_transient_retries_dropped_substrate_websockets(monkeypatch):
+    monkeypatch.setattr(validator_main.time, "sleep", lambda seconds: None)
+    outcomes: list[object] = [ConnectionClosed(None, None), 1234]
+
+    def dropped_read():
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    assert validator_main._retry_transient(dropped_read) == 1234
+    assert outcomes == []
+
+
+def test_library_attribute_errors_take_the_backoff_path():
+    def library_call():
+        # Stands in for bittensor/substrate code choking on a dropped websocket
+        return None.recv()
+
+    with pytest.raises(AttributeError) as library_error:
+        library_call()
+    assert not _is_programmer_error(library_error.value)
+
+    with pytest.raises(AttributeError) as own_error:
+        _resolve_validator_uid(None, "hk-v", 4)
+    assert _is_programmer_error(own_error.value)
+
+    with pytest.raises(ConnectionError) as transient_error:
+        raise ConnectionError("websocket closed")
+    assert not _is_programmer_error(transient_error.value)
+
+
+def test_weekly_cache_round_trips_for_the_same_weekly_epoch(tmp_path):
+    path = _weekly_cache_path(str(tmp_path / "logs"), 35)
+    _save_weekly_cache(
+        path, "2024-11-08T00:00:00Z", "2024-11-01T00:00:00Z", {3: 0.75, 7: 0.25}, {3: 3.0, 7: 1.0}
+    )
+
+    assert _load_weekly_cache(path, "2024-11-08T00:00:00Z") == (
+        {3: 0.75, 7: 0.25},
+        {3: 3.0, 7: 1.0},
+        "2024-11-01T00:00:00Z",
+    )
+    assert _load_weekly_cache(path, "2024-11-15T00:00:00Z") is None
+
+    path.write_text("{not json")
+    assert _load_weekly_cache(path, "2024-11-08T00:00:00Z") is None
+    assert _load_weekly_cache(tmp_path / "missing.json", "2024-11-08T00:00:00Z") is None
@@ -13,7 +13,7 @@ from cartha_validator.processor import process_entries
 
 class DummyWeb3:
     class HTTPProvider:  # type: ignore[assignment]
-        def __init__(self, url: str) -> None:
+        def __init__(self, url: str, **kwargs: Any) -> None:
             self.url = url
 
     def __init__(self, provider: Any) -> None:
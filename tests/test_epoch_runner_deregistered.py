@@ -61,7 +61,7 @@ def _publish_stub(*args, **kwargs):
 
 
 @patch("cartha_validator.epoch_runner.httpx.Client")
-def test_run_epoch_fetches_deregistered_hotkeys(mock_client_class):
+def test_run_epoch_fetches_deregistered_hotkeys(mock_client_class, tmp_path):
     """Test that run_epoch fetches deregistered hotkeys from endpoint."""
     # Mock HTTP client
     mock_client = MagicMock()
@@ -110,6 +110,7 @@ def test_run_epoch_fetches_deregistered_hotkeys(mock_client_class):
         update={
             "rpc_urls": {31337: "http://localhost:8545"},
             "token_decimals": 6,
+            "log_dir": str(tmp_path),
         }
     )
     
@@ -144,7 +145,7 @@ def test_run_epoch_fetches_deregistered_hotkeys(mock_client_class):
 
 
 @patch("cartha_validator.epoch_runner.httpx.Client")
-def test_run_epoch_handles_deregistered_hotkeys_endpoint_failure(mock_client_class):
+def test_run_epoch_handles_deregistered_hotkeys_endpoint_failure(mock_client_class, tmp_path):
     """Test that run_epoch handles deregistered hotkeys endpoint failure gracefully."""
     # Mock HTTP client
     mock_client = MagicMock()
@@ -199,6 +200,7 @@ def test_run_epoch_handles_deregistered_hotkeys_endpoint_failure(mock_client_cla
         update={
             "rpc_urls": {31337: "http://localhost:8545"},
             "token_decimals": 6,
+            "log_dir": str(tmp_path),
         }
     )
     
@@ -235,7 +237,7 @@ def test_run_epoch_handles_deregistered_hotkeys_endpoint_failure(mock_client_cla
 
 
 @patch("cartha_validator.epoch_runner.httpx.Client")
-def test_run_epoch_with_no_deregistered_hotkeys(mock_client_class):
+def test_run_epoch_with_no_deregistered_hotkeys(mock_client_class, tmp_path):
     """Test that run_epoch works correctly when no deregistered hotkeys exist."""
     # Mock HTTP client
     mock_client = MagicMock()
@@ -284,6 +286,7 @@ def test_run_epoch_with_no_deregistered_hotkeys(mock_client_class):
         update={
             "rpc_urls": {31337: "http://localhost:8545"},
             "token_decimals": 6,
+            "log_dir": str(tmp_path),
         }
     )
     
@@ -310,3 +313,36 @@ def test_run_epoch_with_no_deregistered_hotkeys(mock_client_class):
     if summary["scored"] > 0:
         assert 1 in weights
         assert weights[1] > 0.0
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_json_matches_stdlib_output(monkeypatch, use_orjson):
+    import json
+
+    from cartha_validator import epoch_runner
+
+    if not use_orjson:
+        monkeypatch.setattr(epoch_runner, "orjson", None)
+    elif epoch_runner.orjson is None:
+        pytest.skip("orjson not installed")
+
+    payload = {"summary": {"scored": 2}, "ranking": [{"uid": 1, "weight": 0.5}], "by_uid": {3: 1.0}}
+    compact = epoch_runner._dump_json(payload, indent=False)
+    indented = epoch_runner._dump_json(payload, indent=True)
+
+    assert json.loads(compact) == json.loads(indented) == json.loads(json.dumps(payload))
+    assert b"\n" not in compact
+    assert indented.startswith(b'{\n  "summary"')
+
+
+def test_dump_json_falls_back_for_integers_beyond_64_bits():
+    import json
+
+    from cartha_validator import epoch_runner
+
+    payload = {"positions": {"pool-a": {"amountRaw": 2**70 + 1}}, "by_uid": {3: 1.0}}
+
+    assert epoch_runner._dump_json(payload, indent=True) == json.dumps(payload, indent=2).encode()
+    assert json.loads(epoch_runner._dump_json(payload, indent=False)) == json.loads(
+        json.dumps(payload)
+    )
@@ -0,0 +1,30 @@
+"""Tests for leaderboard ranking submission."""
+
+from __future__ import annotations
+
+import httpx
+
+from cartha_validator.leaderboard_client import send_ranking_to_leaderboard
+
+
+def test_send_ranking_reuses_caller_client():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"submission_id": 1})
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        for _ in range(2):
+            send_ranking_to_leaderboard(
+                "https://leaderboard.local/",
+                "bt1-validator",
+                "2024-11-08T00:00:00Z",
+                [{"uid": 1, "weight": 1.0}],
+                client=client,
+            )
+        assert not client.is_closed
+
+    assert [str(request.url) for request in requests] == [
+        "https://leaderboard.local/v1/leaderboard/submit"
+    ] * 2
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 import pytest
 
-from cartha_validator.config import DEFAULT_SETTINGS
-from cartha_validator.processor import process_entries
+from cartha_validator.config import DEFAULT_SETTINGS, ValidatorSettings
+from cartha_validator.processor import process_entries, resolve_entry
 
 
 class DummyWeb3:
     class HTTPProvider:  # type: ignore[assignment]
-        def __init__(self, url: str) -> None:
+        def __init__(self, url: str, **kwargs: Any) -> None:
             self.url = url
 
     def __init__(self, provider: Any) -> None:
@@ -24,6 +25,25 @@ def patch_web3(monkeypatch):
     yield
 
 
+@pytest.fixture
+def settings() -> ValidatorSettings:
+    return DEFAULT_SETTINGS.model_copy(
+        update={"rpc_urls": {31337: "http://localhost:8545"}, "token_decimals": 6}
+    )
+
+
+class UidSubtensor:
+    """Subtensor stub resolving UIDs from a fixed map; any other lookup fails the test."""
+
+    def __init__(self, uids: Mapping[str, int] | None = None) -> None:
+        self._uids = dict(uids or {})
+
+    def get_uid_for_hotkey_on_subnet(self, hotkey_ss58: str, netuid: int) -> int:
+        if hotkey_ss58 not in self._uids:
+            raise AssertionError(f"Unexpected chain UID lookup for {hotkey_ss58}")
+        return self._uids[hotkey_ss58]
+
+
 def _replay_stub(chain_id: int, vault: str, owner: str, at_block: int, web3=None):
     return {"default": {"amount": 1_000_000_000, "lockDays": 180}}
 
@@ -123,3 +143,148 @@ def test_process_entries_publishes(monkeypatch):
     summary = result["summary"]
     assert summary["scored"] == 1
     assert summary["failures"] == 0
+
+
+def test_resolve_entry_extracts_replay_fields() -> None:
+    entry = {
+        "chain_id": 31337,
+        "vault": "0xVault",
+        "miner_evm_address": "0xOwner",
+        "atBlock": "123",
+    }
+    assert resolve_entry(entry) == (31337, "0xVault", "0xOwner", 123)
+    assert resolve_entry({"block": "not-a-number"}) == (None, None, None, None)
+
+
+def test_process_entries_overlaps_replays(settings):
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def replay_both_in_flight(chain_id, vault, owner, at_block, web3=None):
+        barrier.wait()  # raises BrokenBarrierError if replays ran one at a time
+        return {"default": {"amount": 1_000_000_000, "lockDays": 180}}
+
+    entries = [
+        {
+            "hotkey": hotkey,
+            "chain_id": 31337,
+            "vault": "0xVault",
+            "evm": owner,
+            "snapshotBlock": 100,
+        }
+        for hotkey, owner in (("bt1-hk1", "0xOwner1"), ("bt1-hk2", "0xOwner2"))
+    ]
+
+    result = process_entries(
+        entries,
+        settings.model_copy(update={"replay_concurrency": 2}),
+        epoch_version="2024-11-08T00:00:00Z",
+        dry_run=True,
+        replay_fn=replay_both_in_flight,
+        subtensor=UidSubtensor({"bt1-hk1": 1, "bt1-hk2": 2}),
+    )
+
+    assert result["summary"]["scored"] == 2
+    assert result["summary"]["failures"] == 0
+
+
+def test_get_head_block_reuses_read_within_ttl():
+    from cartha_validator.processor import _get_head_block
+
+    class Eth:
+        reads = 0
+
+        @property
+        def block_number(self) -> int:
+            Eth.reads += 1
+            return 700 + Eth.reads
+
+    provider = type("Provider", (), {"eth": Eth()})()
+    cache: dict[int, tuple[int, float]] = {}
+    assert _get_head_block(1, provider, cache) == 701
+    assert _get_head_block(1, provider, cache) == 701
+    assert _get_head_block(1, provider, cache, ttl=0.0) == 702
+    assert Eth.reads == 2
+
+
+def test_process_entries_dedupes_identical_replays(settings):
+    calls: list[tuple] = []
+
+    def counting_replay(chain_id, vault, owner, at_block, web3=None):
+        calls.append((chain_id, vault, owner, at_block))
+        return {"default": {"amount": 1_000_000_000, "lockDays": 180}}
+
+    entry = {
+        "hotkey": "bt1-hk1",
+        "chain_id": 31337,
+        "vault": "0xVault",
+        "evm": "0xOwner",
+        "atBlock": 100,
+    }
+
+    result = process_entries(
+        [entry, {**entry, "vault": "0xVAULT"}],
+        settings,
+        epoch_version="2024-11-08T00:00:00Z",
+        dry_run=True,
+        replay_fn=counting_replay,
+        subtensor=UidSubtensor({"bt1-hk1": 1}),
+    )
+
+    assert len(calls) == 1
+    assert len(result["ranking"][0]["positions"]) == 2
+
+
+def test_process_entries_resolves_uids_from_metagraph(settings):
+    metagraph = type("Metagraph", (), {"hotkeys": ["bt1-validator", "bt1-hk1"]})()
+    result = process_entries(
+        [{"hotkey": "bt1-hk1", "chain_id": 31337, "vault": "0xVault", "evm": "0xOwner"}],
+        settings,
+        epoch_version="2024-11-08T00:00:00Z",
+        dry_run=True,
+        replay_fn=_replay_stub,
+        subtensor=UidSubtensor(),
+        metagraph=metagraph,
+    )
+
+    assert result["ranking"][0]["uid"] == 1
+
+
+def test_format_positions_renders_usdc_amounts():
+    from cartha_validator.processor import format_positions
+
+    formatted = format_positions(
+        {
+            "pool-a#0": {"pool_id": "pool-a", "amount": 1_234_567_890, "lockDays": 30},
+            "pool-b": {"amount": "5", "lockDays": "7"},
+        },
+        10**6,
+    )
+
+    assert formatted["pool-a#0"] == {
+        "pool_id": "pool-a",
+        "amountRaw": 1_234_567_890,
+        "amountUSDC": "1,234.567890 USDC",
+        "lockDays": 30,
+    }
+    assert formatted["pool-b"]["pool_id"] == "pool-b"
+    assert formatted["pool-b"]["amountRaw"] == 5
+    assert formatted["pool-b"]["lockDays"] == 7
+
+    huge = format_positions({"whale": {"amount": 2**60 + 1}}, 10**6)
+    assert huge["whale"]["amountUSDC"] == f"{(2**60 + 1) / 10**6:,.6f} USDC"
+
+
+def test_process_entries_uses_caller_hotkey_index(settings):
+    result = process_entries(
+        [{"hotkey": "bt1-hk1", "chain_id": 31337, "vault": "0xVault", "evm": "0xOwner"}],
+        settings,
+        epoch_version="2024-11-08T00:00:00Z",
+        dry_run=True,
+        replay_fn=_replay_stub,
+        subtensor=UidSubtensor(),
+        hotkey_to_uid={"bt1-hk1": 7},
+    )
+
+    assert result["ranking"][0]["uid"] == 7
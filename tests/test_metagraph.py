@@ -0,0 +1,86 @@
+"""Tests for the get_metagraph_info-backed metagraph view."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from cartha_validator.metagraph import MetagraphSnapshot, load_metagraph
+
+
+class InfoSubtensor:
+    def __init__(self) -> None:
+        self.queries = 0
+        self.field_indices: list | None = None
+
+    def get_metagraph_info(self, netuid: int, field_indices=None, block: int | None = None):
+        self.queries += 1
+        self.field_indices = field_indices
+        return SimpleNamespace(
+            hotkeys=["hk-owner", "hk-validator", "hk-miner"],
+            last_update=[10, 20 + self.queries, 30],
+            block=1_000 + self.queries,
+            tempo=360,
+            owner_hotkey="hk-owner",
+        )
+
+
+def test_load_metagraph_uses_single_info_query():
+    subtensor = InfoSubtensor()
+
+    metagraph = load_metagraph(subtensor, netuid=35)
+
+    assert isinstance(metagraph, MetagraphSnapshot)
+    assert subtensor.queries == 1
+    assert metagraph.hotkeys.index("hk-validator") == 1
+    assert metagraph.n == 3
+    assert (metagraph.block, metagraph.tempo) == (1_001, 360)
+    assert metagraph.owner_hotkey == "hk-owner"
+    assert subtensor.field_indices is not None
+
+    metagraph.sync(subtensor=subtensor)
+    assert metagraph.last_update[1] == 22
+    assert metagraph.block == 1_002
+
+
+def test_load_metagraph_falls_back_to_full_metagraph():
+    synced = []
+    full = SimpleNamespace(block=0, sync=lambda subtensor: synced.append(subtensor))
+    subtensor = SimpleNamespace(metagraph=lambda netuid: full)
+
+    assert load_metagraph(subtensor, netuid=35) is full
+    assert synced == [subtensor]
+
+    # subtensor.metagraph() normally returns a graph that is already synced
+    full.block = 500
+    assert load_metagraph(subtensor, netuid=35) is full
+    assert synced == [subtensor]
+
+
+def test_snapshot_sync_rejects_missing_subnet():
+    subtensor = SimpleNamespace(
+        get_metagraph_info=lambda netuid, field_indices=None, block=None: None
+    )
+
+    with pytest.raises(RuntimeError):
+        MetagraphSnapshot(99).sync(subtensor=subtensor)
+
+
+def test_snapshot_falls_back_to_full_query_when_selection_drops_fields():
+    class PartialSubtensor(InfoSubtensor):
+        def get_metagraph_info(self, netuid: int, field_indices=None, block: int | None = None):
+            info = super().get_metagraph_info(netuid, field_indices, block)
+            if field_indices is not None:
+                info.hotkeys = None
+            return info
+
+    subtensor = PartialSubtensor()
+    metagraph = MetagraphSnapshot(35)
+    metagraph.sync(subtensor=subtensor)
+
+    assert metagraph.n == 3
+    assert subtensor.queries == 2
+    metagraph.sync(subtensor=subtensor)
+    assert subtensor.queries == 3
+    assert subtensor.field_indices is None
@@ -295,3 +295,15 @@ def test_replay_owner_multi_pool_support() -> None:
         "default": {"amount": 150, "lockDays": 45},
         "oil": {"amount": 400, "lockDays": 60},
     }
+
+
+def test_rpc_session_is_reused_per_thread_only() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from cartha_validator.indexer import get_rpc_session
+
+    session = get_rpc_session()
+    assert get_rpc_session() is session
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        worker_session = pool.submit(get_rpc_session).result()
+    assert worker_session is not session
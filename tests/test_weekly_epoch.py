@@ -398,3 +398,47 @@ def test_weights_use_tempo_from_metagraph(monkeypatch):
 
     # Should return weights but may skip actual publishing
     assert result2 is not None
+
+
+def test_epoch_meta_matches_epoch_start():
+    """Test that cached epoch metadata agrees with epoch_start for any point in the week."""
+    from cartha_validator.epoch import EPOCH_LENGTH, epoch_index, epoch_meta, epoch_start
+
+    for reference in (
+        datetime(2024, 1, 5, 0, 0, 0, tzinfo=UTC),  # Friday boundary
+        datetime(2024, 1, 8, 10, 0, 0, tzinfo=UTC),  # Monday
+        datetime(2024, 1, 11, 23, 59, 59, tzinfo=UTC),  # Thursday, last second
+    ):
+        start, next_start, version = epoch_meta(epoch_index(reference))
+        assert start == epoch_start(reference)
+        assert next_start == start + EPOCH_LENGTH
+        assert version == start.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    assert epoch_index(datetime(2024, 1, 12, tzinfo=UTC)) == epoch_index(
+        datetime(2024, 1, 11, 23, 59, 59, tzinfo=UTC)
+    ) + 1
+
+
+def test_epoch_index_at_matches_datetime_index():
+    """Test that the timestamp-based epoch helpers agree with the datetime ones."""
+    from cartha_validator.epoch import (
+        epoch_index,
+        epoch_index_at,
+        epoch_meta,
+        epoch_start_ts,
+    )
+
+    reference = datetime(2024, 1, 11, 23, 59, 59, tzinfo=UTC)
+    index = epoch_index_at(reference.timestamp())
+    assert index == epoch_index(reference)
+    start, next_start, _ = epoch_meta(index)
+    assert epoch_start_ts(index) == start.timestamp()
+    assert epoch_start_ts(index + 1) == next_start.timestamp()
+
+
+def test_config_epoch_version_matches_current_epoch_start():
+    from cartha_validator.config import epoch_version
+    from cartha_validator.epoch import EPOCH_VERSION_FORMAT, epoch_start
+
+    assert epoch_version("2024-11-08T00:00:00Z") == "2024-11-08T00:00:00Z"
+    assert epoch_version(None) == epoch_start().strftime(EPOCH_VERSION_FORMAT)